@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+bench_jira.py
+=============
+Times the full setup_jira.py run against mock_jira.py with synthetic
+boards, so changes can be compared without touching a live tenant.
+
+Usage:
+    python bench_jira.py                                  # 20, 1k and 10k stories
+    python bench_jira.py --sizes 20,1000 --latency 30 --rate-limit 200
+    python bench_jira.py --setup-args="--bulk" --rerun --json bench.json
+
+For each board size a fresh mock tenant is started, setup_jira.main() runs
+in-process with its output discarded, and the report shows wall and CPU
+time, request count, bytes on the wire, and per-endpoint p50/p95 latency
+as recorded by setup_jira's request hooks. --rerun times a second pass over the now-populated tenant
+as well.
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import shlex
+import sys
+import tempfile
+
+# Point setup_jira at the mock before it is imported, so a real .env can
+# never send benchmark traffic to a live site.
+os.environ["JIRA_BASE_URL"]  = "http://127.0.0.1:9"
+os.environ["JIRA_EMAIL"]     = "bench@example.com"
+os.environ["JIRA_API_TOKEN"] = "bench-token"
+
+import setup_jira  # noqa: E402
+from mock_jira import start_server  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Synthetic boards
+# ---------------------------------------------------------------------------
+
+def make_board(n_stories, stories_per_epic=25, ac_lines=4):
+    """Return a BOARD-shaped list with `n_stories` stories."""
+    board = []
+    for e in range(math.ceil(n_stories / stories_per_epic)):
+        first = e * stories_per_epic
+        count = min(stories_per_epic, n_stories - first)
+        board.append({
+            "epic_summary": f"Synthetic epic {e + 1:04d}",
+            "epic_description": f"Benchmark epic {e + 1} holding stories {first + 1}-{first + count}.",
+            "stories": [
+                (
+                    f"Synthetic story {first + s + 1:05d}",
+                    [f"Acceptance criterion {n + 1} for story {first + s + 1}" for n in range(ac_lines)],
+                )
+                for s in range(count)
+            ],
+        })
+    return board
+
+
+# ---------------------------------------------------------------------------
+# Runs
+# ---------------------------------------------------------------------------
+
+def reset_setup(base_url, workdir, client_rate):
+    """Give setup_jira fresh module state pointed at `base_url`."""
+    setup_jira.JIRA_BASE_URL = base_url
+    setup_jira.LIMITER = setup_jira.RateLimiter(rate=client_rate, max_rate=client_rate * 10)
+    setup_jira.CLIENT = setup_jira.JiraClient(base_url, setup_jira.AUTH)
+    setup_jira.MANIFEST = None
+    setup_jira.MANIFEST_PATH = os.path.join(workdir, ".jira_sync.json")
+    setup_jira.README_PATH = os.path.join(workdir, "README.md")
+    setup_jira.JOURNAL_PATH = os.path.join(workdir, ".jira_journal.jsonl")
+    setup_jira._ISSUE_INDEX.clear()
+    setup_jira._TRANSITIONS.clear()
+    setup_jira.METRICS.reset()
+
+
+def timed_run(setup_args):
+    """Run the setup once and return setup_jira's own per-endpoint metrics."""
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        setup_jira.main(setup_args + ["--metrics", ""])
+    summary = setup_jira.METRICS.summary()
+    return {
+        "wall_s":   summary["wall_s"],
+        "requests": summary["requests"],
+        "network_s": summary["network_s"],
+        "wait_s":   summary["wait_s"],
+        "cpu_s":    summary["cpu_s"],
+        "bytes_out": summary["bytes_out"],
+        "bytes_in": summary["bytes_in"],
+        "endpoints": {
+            name: {"count": e["count"], "p50_ms": e["latency_ms"]["p50"], "p95_ms": e["latency_ms"]["p95"]}
+            for name, e in summary["endpoints"].items()
+        },
+    }
+
+
+def bench_size(n_stories, args):
+    server, base_url = start_server(latency_ms=args.latency, jitter_ms=args.jitter,
+                                    rate_limit=args.rate_limit)
+    setup_jira.BOARD = make_board(n_stories)
+    results = {"stories": n_stories, "epics": len(setup_jira.BOARD)}
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            reset_setup(base_url, workdir, args.client_rate)
+            results["first"] = timed_run(args.setup_args)
+            if args.rerun:
+                reset_setup(base_url, workdir, args.client_rate)
+                results["rerun"] = timed_run(args.setup_args)
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def print_report(results):
+    for run in ("first", "rerun"):
+        if run not in results:
+            continue
+        r = results[run]
+        print(f"\n{results['stories']} stories / {results['epics']} epics — {run} run: "
+              f"{r['wall_s']:.2f}s ({r['cpu_s']:.2f}s CPU), {r['requests']} requests, "
+              f"{r['bytes_out'] / 1024:.0f} KB out, {r['bytes_in'] / 1024:.0f} KB in")
+        print(f"  {'endpoint':<36} {'count':>7} {'p50 ms':>9} {'p95 ms':>9}")
+        for endpoint, e in r["endpoints"].items():
+            print(f"  {endpoint:<36} {e['count']:>7} {e['p50_ms']:>9.2f} {e['p95_ms']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark setup_jira.py against the mock Jira server.")
+    parser.add_argument("--sizes", default="20,1000,10000",
+                        help="comma-separated story counts (default: 20,1000,10000)")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS",
+                        help="mock server latency per request")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="MS",
+                        help="random extra mock latency, 0..MS")
+    parser.add_argument("--rate-limit", type=float, default=0.0, metavar="RPS",
+                        help="mock server rate limit (0 = unlimited)")
+    parser.add_argument("--client-rate", type=float, default=500.0, metavar="RPS",
+                        help="starting rate for setup_jira's limiter")
+    parser.add_argument("--setup-args", default="", metavar="ARGS",
+                        help='extra setup_jira.py arguments, e.g. "--bulk" or "--workers 8"')
+    parser.add_argument("--rerun", action="store_true",
+                        help="also time a second run against the populated tenant")
+    parser.add_argument("--json", metavar="PATH",
+                        help="write the results as JSON for comparing runs")
+    args = parser.parse_args()
+    args.setup_args = shlex.split(args.setup_args)
+
+    all_results = []
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        results = bench_size(size, args)
+        print_report(results)
+        all_results.append(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"argv": sys.argv[1:], "results": all_results}, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
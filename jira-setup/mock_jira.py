@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""
+mock_jira.py
+============
+In-memory stand-in for the parts of the Jira Cloud REST API that
+setup_jira.py uses, so the setup can be run and timed without a live
+tenant.
+
+Usage:
+    python mock_jira.py --port 8080 --latency 40 --rate-limit 20
+    JIRA_BASE_URL=http://127.0.0.1:8080 JIRA_EMAIL=x JIRA_API_TOKEN=x \\
+        python setup_jira.py
+
+Endpoints (all under /rest/api/3):
+    GET  /myself
+    GET  /project/{key}            POST /project
+    POST /search/jql               (project, issuetype, labels, summary ~, updated >=, ORDER BY)
+    POST /issue                    POST /issue/bulk
+    GET  /issue/{key}              PUT  /issue/{key}
+    GET  /issue/{key}/transitions  POST /issue/{key}/transitions
+
+GET responses carry an ETag and answer a matching If-None-Match with 304.
+Like Jira Cloud, responses of GZIP_MIN bytes or more are gzipped for
+clients that accept it, and gzipped request bodies are accepted.
+Latency is added to every response. With a rate limit set, requests over
+the limit get a 429 with Retry-After and X-RateLimit-* headers, like Jira.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_PREFIX = "/rest/api/3"
+GZIP_MIN = 1024  # smallest response body worth compressing
+
+# A simplified Kanban workflow: every status can move to every other one
+STATUSES = [
+    ("11", "To Do",       "new"),
+    ("21", "In Progress", "indeterminate"),
+    ("31", "Done",        "done"),
+]
+
+
+# ---------------------------------------------------------------------------
+# Tenant state
+# ---------------------------------------------------------------------------
+
+class MockTenant:
+    """Projects and issues held in memory, guarded by one lock."""
+
+    def __init__(self, rate_limit=0.0):
+        self.lock = threading.Lock()
+        self.projects = {}  # {key: project}
+        self.issues = {}    # {key: issue}, in creation order
+        self.next_id = 10000
+        self.counters = {}  # {project_key: last issue number}
+        self.rate_limit = rate_limit
+        self.tokens = rate_limit
+        self.updated = time.monotonic()
+
+    # -- rate limiting ------------------------------------------------------
+
+    def take_token(self):
+        """Return (allowed, remaining, retry_after) for one request."""
+        if not self.rate_limit:
+            return True, None, None
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate_limit, self.tokens + (now - self.updated) * self.rate_limit)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True, int(self.tokens), None
+            return False, 0, (1 - self.tokens) / self.rate_limit
+
+    # -- issues -------------------------------------------------------------
+
+    def create_issue(self, fields):
+        """Create one issue; return (issue, error message)."""
+        project_key = fields.get("project", {}).get("key")
+        summary = fields.get("summary", "")
+        if project_key not in self.projects:
+            return None, "project: project is required"
+        if not summary.strip():
+            return None, "summary: You must specify a summary of the issue."
+        if len(summary) > 255:
+            return None, "summary: Summary must be less than 255 characters."
+        parent = fields.get("parent", {}).get("key")
+        if parent and parent not in self.issues:
+            return None, f"parent: Issue {parent} does not exist."
+
+        self.next_id += 1
+        number = self.counters[project_key] = self.counters.get(project_key, 0) + 1
+        key = f"{project_key}-{number}"
+        stored = dict(fields)
+        stored.setdefault("labels", [])
+        stored["status"] = self.status_field("To Do")
+        stored["updated"] = now_stamp()
+        stored["created"] = stored["updated"]
+        issue = {"id": str(self.next_id), "key": key, "fields": stored, "properties": {}}
+        self.issues[key] = issue
+        return issue, None
+
+    def update_issue(self, key, fields, update=None):
+        issue = self.issues.get(key)
+        if issue is None:
+            return False
+        issue["fields"].update(fields)
+        labels = issue["fields"].setdefault("labels", [])
+        for op in (update or {}).get("labels", []):
+            if "add" in op and op["add"] not in labels:
+                labels.append(op["add"])
+            if "remove" in op and op["remove"] in labels:
+                labels.remove(op["remove"])
+        issue["fields"]["updated"] = now_stamp()
+        return True
+
+    @staticmethod
+    def status_field(name):
+        for tid, status, category in STATUSES:
+            if status == name:
+                return {"name": status, "statusCategory": {"key": category}}
+        return {"name": name}
+
+    def search(self, jql):
+        """Evaluate the small JQL subset setup_jira.py sends."""
+        clauses, order = parse_jql(jql)
+        hits = [i for i in self.issues.values() if all(c(i) for c in clauses)]
+        if order:
+            field, direction = order
+            hits.sort(key=lambda i: (i["fields"].get(field) or "", int(i["id"])),
+                      reverse=direction == "DESC")
+        return hits
+
+
+def now_stamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "+0000"
+
+
+# ---------------------------------------------------------------------------
+# JQL subset
+# ---------------------------------------------------------------------------
+
+def split_and(jql):
+    """Split a JQL string on top-level AND, respecting quotes and parens."""
+    parts, depth, quoted, start, i = [], 0, False, 0, 0
+    while i < len(jql):
+        ch = jql[i]
+        if ch == "\\" and quoted:
+            i += 2
+            continue
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and jql[i:i + 5].upper() == " AND ":
+            parts.append(jql[start:i])
+            start = i + 5
+            i += 5
+            continue
+        i += 1
+    parts.append(jql[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def unquote(value):
+    value = value.strip()
+    if value.startswith('"') and value.endswith('"'):
+        value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def field_value(issue, name):
+    fields = issue["fields"]
+    if name == "project":
+        return fields["project"]["key"]
+    if name == "issuetype":
+        return fields["issuetype"]["name"]
+    if name == "status":
+        return fields["status"]["name"]
+    if name == "key":
+        return issue["key"]
+    if name == "parent":
+        return fields.get("parent", {}).get("key")
+    return fields.get(name)
+
+
+def values_of(issue, name):
+    """Lower-cased value(s) of a field, as a set, for = and in() on lists."""
+    value = field_value(issue, name)
+    values = value if isinstance(value, list) else [value]
+    return {str(v or "").lower() for v in values}
+
+
+def parse_when(value):
+    """Parse a stored timestamp or a JQL date ("2024/05/01 13:45"), as UTC."""
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y/%m/%d %H:%M", "%Y-%m-%d %H:%M", "%Y/%m/%d", "%Y-%m-%d"):
+        try:
+            when = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+    raise ValueError(f"Unsupported date: {value}")
+
+
+def parse_clause(clause):
+    m = re.match(r'^(\w+)\s*~\s*(".*")$', clause)
+    if m:
+        name, needle = m[1], unquote(m[2]).lower()
+        return lambda i: needle in (field_value(i, name) or "").lower()
+    m = re.match(r'^(\w+)\s+in\s*\((.*)\)$', clause, re.IGNORECASE)
+    if m:
+        name = m[1]
+        wanted = {unquote(v).lower() for v in m[2].split(",")}
+        return lambda i: bool(wanted & values_of(i, name))
+    m = re.match(r'^(\w+)\s*(>=|<=|!=|=)\s*(.+)$', clause)
+    if m:
+        name, op, value = m[1], m[2], unquote(m[3]).lower()
+        dated = name in ("created", "updated")
+        if dated:
+            value = parse_when(value)
+
+        def compare(issue):
+            if isinstance(field_value(issue, name), list):  # labels
+                found = value in values_of(issue, name)
+                return found if op == "=" else not found
+            actual = str(field_value(issue, name) or "").lower()
+            if dated:
+                actual = parse_when(field_value(issue, name))
+            if op == "=":
+                return actual == value
+            if op == "!=":
+                return actual != value
+            if op == ">=":
+                return actual >= value
+            return actual <= value
+        return compare
+    raise ValueError(f"Unsupported JQL clause: {clause}")
+
+
+def parse_jql(jql):
+    order = None
+    m = re.search(r"\s*ORDER BY\s+(\w+)\s*(ASC|DESC)?\s*$", jql, re.IGNORECASE)
+    if m:
+        order = (m[1], (m[2] or "ASC").upper())
+        jql = jql[:m.start()]
+    return [parse_clause(c) for c in split_and(jql)], order
+
+
+# ---------------------------------------------------------------------------
+# HTTP handler
+# ---------------------------------------------------------------------------
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like Jira Cloud
+    disable_nagle_algorithm = True
+    wbufsize = -1                  # one write per response; flushed by the base class
+    tenant = None                  # set by make_server()
+    latency = 0.0                  # seconds added to every response
+    jitter = 0.0
+
+    def log_message(self, fmt, *args):
+        pass
+
+    # -- plumbing -----------------------------------------------------------
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if raw and self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        return json.loads(raw) if raw else {}
+
+    def reply(self, status, body=None, headers=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        headers = dict(headers or {})
+        if len(data) >= GZIP_MIN and "gzip" in self.headers.get("Accept-Encoding", ""):
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def error(self, status, message):
+        self.reply(status, {"errorMessages": [message], "errors": {}})
+
+    def dispatch(self, method):
+        body = self.read_body() if method in ("POST", "PUT") else None
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+        allowed, remaining, retry_after = self.tenant.take_token()
+        if not allowed:
+            reset = datetime.now(timezone.utc) + timedelta(seconds=retry_after)
+            self.reply(429, {"errorMessages": ["Rate limit exceeded."]}, {
+                "Retry-After": f"{max(retry_after, 0.05):.2f}",
+                "X-RateLimit-Limit": str(int(self.tenant.rate_limit)),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": reset.isoformat(),
+            })
+            return
+
+        path = self.path.split("?", 1)[0]
+        if not path.startswith(API_PREFIX):
+            return self.error(404, "Not found")
+        path = path[len(API_PREFIX):]
+
+        for pattern, verb, handler in ROUTES:
+            m = re.fullmatch(pattern, path)
+            if m and verb == method:
+                with self.tenant.lock:
+                    status, payload = handler(self, body, *m.groups())
+                headers = {}
+                if method == "GET" and status == 200:
+                    etag = '"%s"' % hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        status, payload = 304, None
+                if remaining is not None:
+                    headers["X-RateLimit-Limit"] = str(int(self.tenant.rate_limit))
+                    headers["X-RateLimit-Remaining"] = str(remaining)
+                return self.reply(status, payload, headers)
+        self.error(404, f"No mock route for {method} {path}")
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    # -- routes -------------------------------------------------------------
+
+    def myself(self, body):
+        return 200, {"accountId": "mock-account-id", "displayName": "Mock User", "timeZone": "UTC"}
+
+    def get_project(self, body, key):
+        project = self.tenant.projects.get(key)
+        if project is None:
+            return 404, {"errorMessages": [f"No project could be found with key '{key}'."]}
+        return 200, project
+
+    def create_project(self, body):
+        t = self.tenant
+        key = body["key"]
+        if key in t.projects:
+            return 400, {"errors": {"projectKey": f"Project '{key}' uses this project key."}}
+        t.next_id += 1
+        t.projects[key] = {"key": key, "id": str(t.next_id), "name": body["name"]}
+        return 201, {"key": key, "id": t.next_id, "self": f"{API_PREFIX}/project/{t.next_id}"}
+
+    def search(self, body):
+        try:
+            hits = self.tenant.search(body.get("jql", ""))
+        except ValueError as e:
+            return 400, {"errorMessages": [str(e)]}
+        start = int(body.get("nextPageToken") or 0)
+        size = min(int(body.get("maxResults", 50)), 5000)
+        page = hits[start:start + size]
+        wanted = body.get("fields") or []
+        issues = []
+        for issue in page:
+            fields = issue["fields"]
+            if "*all" not in wanted:
+                fields = {f: fields[f] for f in wanted if f in fields}
+            issues.append({"id": issue["id"], "key": issue["key"], "fields": fields})
+        result = {"issues": issues, "isLast": start + size >= len(hits)}
+        if not result["isLast"]:
+            result["nextPageToken"] = str(start + size)
+        return 200, result
+
+    def create_issue(self, body):
+        issue, error = self.tenant.create_issue(body.get("fields", {}))
+        if error:
+            field, _, message = error.partition(": ")
+            return 400, {"errorMessages": [], "errors": {field: message}}
+        return 201, {"id": issue["id"], "key": issue["key"]}
+
+    def create_bulk(self, body):
+        updates = body.get("issueUpdates", [])
+        if len(updates) > 50:
+            return 400, {"errorMessages": ["Cannot create more than 50 issues in one request."]}
+        created, errors = [], []
+        for n, update in enumerate(updates):
+            issue, error = self.tenant.create_issue(update.get("fields", {}))
+            if error:
+                field, _, message = error.partition(": ")
+                errors.append({"status": 400, "failedElementNumber": n,
+                               "elementErrors": {"errorMessages": [], "errors": {field: message}}})
+            else:
+                created.append({"id": issue["id"], "key": issue["key"]})
+        return (201 if created else 400), {"issues": created, "errors": errors}
+
+    def get_issue(self, body, key):
+        issue = self.tenant.issues.get(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 200, {"id": issue["id"], "key": key, "fields": issue["fields"]}
+
+    def update_issue(self, body, key):
+        if not self.tenant.update_issue(key, body.get("fields", {}), body.get("update")):
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 204, None
+
+    def get_transitions(self, body, key):
+        if key not in self.tenant.issues:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        return 200, {"transitions": [
+            {"id": tid, "name": name, "to": {"name": name, "statusCategory": {"key": category}}}
+            for tid, name, category in STATUSES
+        ]}
+
+    def do_transition(self, body, key):
+        issue = self.tenant.issues.get(key)
+        if issue is None:
+            return 404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]}
+        tid = str(body.get("transition", {}).get("id"))
+        for status_id, name, _ in STATUSES:
+            if status_id == tid:
+                issue["fields"]["status"] = self.tenant.status_field(name)
+                issue["fields"]["updated"] = now_stamp()
+                return 204, None
+        return 400, {"errorMessages": [f"Transition id '{tid}' is not valid for this issue."]}
+
+
+ISSUE_KEY = r"([A-Z][A-Z0-9]*-\d+)"
+
+ROUTES = [
+    (r"/myself",                          "GET",  MockJiraHandler.myself),
+    (r"/project",                         "POST", MockJiraHandler.create_project),
+    (r"/project/([A-Z][A-Z0-9]*)",        "GET",  MockJiraHandler.get_project),
+    (r"/search/jql",                      "POST", MockJiraHandler.search),
+    (r"/issue",                           "POST", MockJiraHandler.create_issue),
+    (r"/issue/bulk",                      "POST", MockJiraHandler.create_bulk),
+    (rf"/issue/{ISSUE_KEY}",              "GET",  MockJiraHandler.get_issue),
+    (rf"/issue/{ISSUE_KEY}",              "PUT",  MockJiraHandler.update_issue),
+    (rf"/issue/{ISSUE_KEY}/transitions",  "GET",  MockJiraHandler.get_transitions),
+    (rf"/issue/{ISSUE_KEY}/transitions",  "POST", MockJiraHandler.do_transition),
+]
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def make_server(host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0, rate_limit=0.0):
+    """Build a mock server; port 0 picks a free one. Returns (server, base_url)."""
+    handler = type("Handler", (MockJiraHandler,), {
+        "tenant":  MockTenant(rate_limit=rate_limit),
+        "latency": latency_ms / 1000.0,
+        "jitter":  jitter_ms / 1000.0,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.tenant = handler.tenant
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def start_server(**kwargs):
+    """Run a mock server on a background thread. Returns (server, base_url)."""
+    server, base_url = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an in-memory mock of the Jira Cloud REST API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS",
+                        help="milliseconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="MS",
+                        help="random extra milliseconds, 0..MS, per response")
+    parser.add_argument("--rate-limit", type=float, default=0.0, metavar="RPS",
+                        help="requests per second before answering 429 (0 = unlimited)")
+    args = parser.parse_args()
+
+    server, base_url = make_server(args.host, args.port, args.latency, args.jitter, args.rate_limit)
+    print(f"Mock Jira listening on {base_url}  (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
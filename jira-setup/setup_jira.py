@@ -7,20 +7,74 @@ user stories from scratch.
 
 Usage:
     1. Copy .env.example to .env and fill in your credentials
-    2. pip install requests python-dotenv
-    3. python setup_jira.py
+    2. pip install requests python-dotenv   (plus aiohttp for --async)
+    3. python setup_jira.py              # one request per issue
+       python setup_jira.py --bulk       # stories via /issue/bulk, 50 per request
+       python setup_jira.py --workers 8  # create issues on 8 threads
+       python setup_jira.py --async 200  # asyncio engine, 200 requests in flight
+       python setup_jira.py --board board.yaml   # epics/stories from a file
+       python setup_jira.py --stream --bulk --board board.jsonl
+       python setup_jira.py --plan plan.json     # dry run: what would change
+       python setup_jira.py --apply plan.json    # carry that plan out
+       python setup_jira.py --profile            # per-phase CPU/memory reports
+       python setup_jira.py --set-status "Data Migration=Done"
+       python setup_jira.py --mirror     # refresh the local SQLite copy and report
+       python setup_jira.py --readme-only  # re-render README.md from cached results
+       python setup_jira.py --cache      # reuse /myself and /project responses
+       python setup_jira.py --compact    # gzip large request bodies
+       python setup_jira.py --projects projects.yaml --processes 4
 
-The script is idempotent for epics and stories — it checks whether an
-issue with the same summary already exists before creating it, so it is
-safe to re-run if it fails partway through.
+Every run prints a per-endpoint request table and writes it, with latency
+histograms, to jira_metrics.json (--metrics PATH to move it, '' to skip).
+
+The script is idempotent for epics and stories — each issue it creates is
+labelled with a hash of its BOARD identity, the project's existing epics and
+stories are indexed once up front, and any BOARD item already present is
+skipped, so it is safe to re-run if it fails partway through. Give an item an
+`id` to reword its summary later without a duplicate being created.
+
+Creates are written to .jira_journal.jsonl before they are sent. If a run
+is interrupted, the next one resumes from that journal and only looks up
+the creates that were sent but never confirmed.
+
+Each synced issue's key and a hash of its summary and description are kept
+in .jira_sync.json next to this script. On re-runs unchanged items cost no
+API calls and edited items are updated in place with one PUT each; pass
+--no-manifest to check everything against Jira instead.
 """
 
+import argparse
+import asyncio
+import base64
+import contextlib
+import cProfile
+import functools
+import gzip
+import hashlib
+import multiprocessing
 import os
 import sys
 import json
+import math
+import pickle
+import pstats
+import queue
+import re
+import sqlite3
 import time
+import tracemalloc
+import random
+import threading
+import traceback
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Load .env
@@ -31,6 +85,11 @@ try:
 except ImportError:
     pass  # .env values must already be in the environment
 
+try:
+    import orjson  # optional: several times faster than json for request/response bodies
+except ImportError:
+    orjson = None
+
 JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL", "").rstrip("/")
 JIRA_EMAIL    = os.environ.get("JIRA_EMAIL", "")
 JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN", "")
@@ -41,6 +100,34 @@ if not all([JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN]):
 AUTH    = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
 HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 
+# Connection pool size and transport-level retry count (optional in .env)
+JIRA_POOL_SIZE   = int(os.environ.get("JIRA_POOL_SIZE", "10"))
+JIRA_MAX_RETRIES = int(os.environ.get("JIRA_MAX_RETRIES", "3"))
+
+# How many times one call may be retried after a 429/503 (optional in .env).
+# Kept separate from, and larger than, the transport retry budget so a
+# throttled run slows down instead of failing.
+JIRA_THROTTLE_RETRIES = int(os.environ.get("JIRA_THROTTLE_RETRIES", "20"))
+
+# (connect, read) timeouts in seconds, matched by path prefix — first hit wins.
+# Searches and project creation are slower on large sites than a single issue.
+TIMEOUTS = [
+    ("/search",  (5, 30)),
+    ("/project", (5, 30)),
+    ("",         (5, 15)),
+]
+
+# With --compact, request bodies of at least this many bytes are sent gzipped
+# (optional in .env). Responses are always accepted gzipped.
+JIRA_GZIP_MIN = int(os.environ.get("JIRA_GZIP_MIN", "1024"))
+
+# Request rate in requests/second (optional in .env). The limiter starts at
+# JIRA_RATE and adapts between JIRA_MIN_RATE and JIRA_MAX_RATE from Jira's
+# rate-limit headers and 429/503 responses.
+JIRA_RATE     = float(os.environ.get("JIRA_RATE", "10"))
+JIRA_MIN_RATE = float(os.environ.get("JIRA_MIN_RATE", "0.5"))
+JIRA_MAX_RATE = float(os.environ.get("JIRA_MAX_RATE", "50"))
+
 # ---------------------------------------------------------------------------
 # Project definition
 # ---------------------------------------------------------------------------
@@ -55,6 +142,9 @@ PROJECT_DESC = (
 # Board content
 # Epics → list of (summary, description, stories)
 # Each story is (summary, acceptance_criteria_lines)
+# An epic may also carry "epic_id" and "story_ids" ({story summary: id}):
+# stable identities that let a summary be reworded without Jira seeing a
+# new issue. Items without one are identified by their summary.
 # ---------------------------------------------------------------------------
 BOARD = [
     {
@@ -243,42 +333,966 @@ BOARD = [
     },
 ]
 
+BUILTIN_BOARD = BOARD
+
+
+def story_id(block, story_summary):
+    """Return a story's stable id from its epic's block, if it has one."""
+    return block.get("story_ids", {}).get(story_summary)
+
+
+# ---------------------------------------------------------------------------
+# Board definition files
+# --board PATH replaces BOARD with a YAML or JSON file of the form
+#
+#     epics:
+#       - summary: Azure SQL Setup & Schema
+#         description: Provision the Azure SQL instance, ...
+#         stories:
+#           - id: provision-sql        # optional stable identity, see BOARD
+#             summary: Provision Azure SQL Database instance
+#             acceptance_criteria:
+#               - Azure SQL serverless instance created ...
+#
+# A .jsonl board holds one epic mapping (as above) per line, so --stream can
+# read it a line at a time.
+#
+# The validated board is pickled into .board_cache/ keyed by the file's
+# mtime, size and sha256, so a large board is only parsed and validated
+# again after it actually changes.
+# ---------------------------------------------------------------------------
+
+BOARD_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".board_cache")
+BOARD_SCHEMA_VERSION = 1  # bump when the compiled form changes
+MAX_SUMMARY = 255         # Jira rejects longer summaries
+
+
+class BoardError(ValueError):
+    """A board or projects file that does not match its schema."""
+
+
+def _check_keys(where, item, required, optional=()):
+    if not isinstance(item, dict):
+        raise BoardError(f"{where}: expected a mapping, got {type(item).__name__}")
+    missing = [k for k in required if k not in item]
+    if missing:
+        raise BoardError(f"{where}: missing {', '.join(missing)}")
+    unknown = sorted(set(item) - set(required) - set(optional))
+    if unknown:
+        raise BoardError(f"{where}: unknown key(s) {', '.join(unknown)}")
+
+
+def _check_text(where, value, limit=None, allow_empty=False):
+    if not isinstance(value, str):
+        raise BoardError(f"{where}: expected a string, got {type(value).__name__}")
+    if not allow_empty and not value.strip():
+        raise BoardError(f"{where}: must not be empty")
+    if limit and len(value) > limit:
+        raise BoardError(f"{where}: longer than {limit} characters")
+    return value
+
+
+def _check_unique(seen, where, kind, ident, summary):
+    """Reject a second BOARD item with the same identity (id, else summary)."""
+    name = (kind, normalize_summary(ident or summary))
+    if name in seen:
+        field, value = ("id", ident) if ident else ("summary", summary)
+        raise BoardError(f"{where}.{field}: duplicate {kind} \"{value}\"")
+    seen.add(name)
+
+
+def validate_board(data):
+    """Check a parsed board file and return it in BOARD's shape."""
+    _check_keys("board", data, ["epics"])
+    if not isinstance(data["epics"], list) or not data["epics"]:
+        raise BoardError("epics: expected a non-empty list")
+
+    seen = set()
+    return [validate_epic(f"epics[{e}]", epic, seen) for e, epic in enumerate(data["epics"])]
+
+
+def validate_epic(where, epic, seen):
+    """Check one epic mapping and return its BOARD block; `seen` spans the board."""
+    _check_keys(where, epic, ["summary", "stories"], ["id", "description"])
+    summary = _check_text(f"{where}.summary", epic["summary"], MAX_SUMMARY)
+    description = _check_text(f"{where}.description", epic.get("description", ""), allow_empty=True)
+    block = {"epic_summary": summary, "epic_description": description, "stories": []}
+    if "id" in epic:
+        block["epic_id"] = _check_text(f"{where}.id", epic["id"])
+    _check_unique(seen, where, "epic", block.get("epic_id"), summary)
+    if not isinstance(epic["stories"], list):
+        raise BoardError(f"{where}.stories: expected a list")
+
+    for s, story in enumerate(epic["stories"]):
+        swhere = f"{where}.stories[{s}]"
+        _check_keys(swhere, story, ["summary"], ["id", "acceptance_criteria"])
+        story_summary = _check_text(f"{swhere}.summary", story["summary"], MAX_SUMMARY)
+        if "id" in story:
+            block.setdefault("story_ids", {})[story_summary] = _check_text(f"{swhere}.id", story["id"])
+        _check_unique(seen, swhere, "story", story_id(block, story_summary), story_summary)
+        ac = story.get("acceptance_criteria", [])
+        if not isinstance(ac, list):
+            raise BoardError(f"{swhere}.acceptance_criteria: expected a list")
+        lines = [_check_text(f"{swhere}.acceptance_criteria[{n}]", line) for n, line in enumerate(ac)]
+        block["stories"].append((story_summary, lines))
+    return block
+
+
+def parse_jsonl_epics(path, lines):
+    """Yield the epic mapping on each non-blank line of a .jsonl board."""
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise BoardError(f"{path}:{n}: {e}")
+
+
+def is_jsonl(path):
+    return bool(path) and path.lower().endswith(".jsonl")
+
+
+def iter_board_file(path):
+    """Yield the blocks of a .jsonl board a line at a time, validated as they are read."""
+    seen = set()
+    with open(path, encoding="utf-8") as f:
+        for e, epic in enumerate(parse_jsonl_epics(path, f)):
+            yield validate_epic(f"epics[{e}]", epic, seen)
+
+
+def parse_definition_file(path, raw):
+    """Parse board or projects file bytes as JSON, JSON Lines (.jsonl) or YAML (.yaml/.yml)."""
+    if is_jsonl(path):
+        return {"epics": list(parse_jsonl_epics(path, raw.splitlines()))}
+    if path.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise BoardError(f"{path}: reading YAML boards needs PyYAML (pip install pyyaml)")
+        try:
+            return yaml.safe_load(raw)
+        except yaml.YAMLError as e:
+            raise BoardError(f"{path}: {e}")
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise BoardError(f"{path}: {e}")
+
+
+def board_cache_path(path):
+    name = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(BOARD_CACHE_DIR, f"{name}.pickle")
+
+
+def load_board(path):
+    """Return the board defined in `path`, from the compiled cache when fresh."""
+    st = os.stat(path)
+    cache_path = board_cache_path(path)
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("schema") != BOARD_SCHEMA_VERSION:
+            cached = None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        cached = None
+
+    # Same mtime and size: trust the cache without reading the file
+    if cached and (cached["mtime_ns"], cached["size"]) == (st.st_mtime_ns, st.st_size):
+        return cached["board"]
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    if cached and cached["sha256"] == digest:
+        board = cached["board"]  # touched but not changed
+    else:
+        board = validate_board(parse_definition_file(path, raw))
+
+    os.makedirs(BOARD_CACHE_DIR, exist_ok=True)
+    tmp = f"{cache_path}.{os.getpid()}.tmp"  # --projects workers may race
+    with open(tmp, "wb") as f:
+        pickle.dump({"schema": BOARD_SCHEMA_VERSION, "mtime_ns": st.st_mtime_ns,
+                     "size": st.st_size, "sha256": digest, "board": board},
+                    f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, cache_path)
+    return board
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+def parse_retry_after(value):
+    """Return seconds to wait from a Retry-After header (seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def parse_reset(value):
+    """Return seconds until an X-RateLimit-Reset timestamp, if it parses."""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Token bucket shared by every thread, tuned by Jira's own feedback.
+
+    The rate climbs by a fixed step per successful response (by 10% when
+    X-RateLimit-* headers show more than half the budget left) and halves on
+    every 429/503, so throughput settles near what the tenant allows.
+    A throttled response also pauses all callers until Retry-After (plus
+    jitter, so threads do not stampede back in together) has passed.
+    """
+
+    def __init__(self, rate=JIRA_RATE, min_rate=JIRA_MIN_RATE,
+                 max_rate=JIRA_MAX_RATE, increase=0.5, max_backoff=60.0):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.max_backoff = max_backoff
+        self.burst = max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def take(self):
+        """Take a token if one is free; otherwise return the seconds until one may be."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if now >= self.paused_until and self.tokens >= 1:
+                self.tokens -= 1
+                return None
+            return max(self.paused_until - now, (1 - self.tokens) / self.rate)
+
+    def acquire(self):
+        """Block until a request may be sent; return the seconds spent waiting."""
+        waited = 0.0
+        while (wait := self.take()) is not None:
+            time.sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(self):
+        """acquire() for coroutines: waits without blocking the event loop."""
+        waited = 0.0
+        while (wait := self.take()) is not None:
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def feedback(self, response, attempt):
+        """Adjust the rate from a response; return the backoff if throttled."""
+        headers = response.headers
+        with self.lock:
+            if response.status_code in (429, 503):
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.burst = max(1.0, self.rate)
+                delay = parse_retry_after(headers.get("Retry-After"))
+                if delay is None:
+                    delay = min(self.max_backoff, 2 ** attempt)
+                delay += random.uniform(0, delay * 0.25 + 0.1)
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+                self.tokens = 0.0
+                return delay
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            limit = headers.get("X-RateLimit-Limit")
+            if remaining is not None and remaining.isdigit():
+                if int(remaining) == 0:
+                    reset = parse_reset(headers.get("X-RateLimit-Reset"))
+                    if reset:
+                        self.paused_until = max(self.paused_until, time.monotonic() + reset)
+                    self.rate = max(self.min_rate, self.rate / 2)
+                    self.burst = max(1.0, self.rate)
+                    self.tokens = min(self.tokens, self.burst)
+                    return None
+                if limit and limit.isdigit():
+                    if int(remaining) < int(limit) * 0.1:
+                        # Running low: hold the current rate rather than climbing
+                        return None
+                    if int(remaining) > int(limit) * 0.5:
+                        self.rate = min(self.max_rate, self.rate * 1.1)
+                        self.burst = max(1.0, self.rate)
+                        return None
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            self.burst = max(1.0, self.rate)
+            return None
+
+
+LIMITER = RateLimiter()
+
+
+# ---------------------------------------------------------------------------
+# Request instrumentation
+# JiraClient.request hands every call to each function in REQUEST_HOOKS as a
+# dict: method, endpoint (path template), status, expected (an error status
+# the caller handles, such as 404 from an existence probe), latency_s,
+# wait_s (held by the rate limiter), retries, throttled (429/503 retries),
+# bytes_out and bytes_in.
+# ---------------------------------------------------------------------------
+
+METRICS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_metrics.json")
+
+# Upper bounds, in ms, of the per-endpoint latency histogram buckets
+LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def path_template(path):
+    """Collapse issue and project keys so calls group by endpoint."""
+    path = re.sub(r"/[A-Z][A-Z0-9]*-\d+", "/{key}", path)
+    return re.sub(r"^/project/[A-Z][A-Z0-9]*$", "/project/{key}", path)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class RunMetrics:
+    """Collects per-endpoint call records for one run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = []
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+
+    def record(self, call):
+        with self.lock:
+            self.calls.append(call)
+
+    def summary(self):
+        with self.lock:
+            calls = list(self.calls)
+        endpoints = {}
+        for call in calls:
+            endpoints.setdefault(f"{call['method']} {call['endpoint']}", []).append(call)
+
+        report = {}
+        for name, group in sorted(endpoints.items()):
+            latencies = [c["latency_s"] * 1000 for c in group]
+            statuses = {}
+            for c in group:
+                statuses[str(c["status"])] = statuses.get(str(c["status"]), 0) + 1
+            histogram = {f"<={b}": 0 for b in LATENCY_BUCKETS}
+            histogram[f">{LATENCY_BUCKETS[-1]}"] = 0
+            for ms in latencies:
+                bucket = next((f"<={b}" for b in LATENCY_BUCKETS if ms <= b), f">{LATENCY_BUCKETS[-1]}")
+                histogram[bucket] += 1
+            report[name] = {
+                "count":     len(group),
+                # Statuses the caller asked for (e.g. a 404 existence probe)
+                # are not failures; 4xx and 5xx are kept apart so server-side
+                # trouble stands out from bad requests.
+                "expected":  sum(1 for c in group if c["expected"]),
+                "client_errors": sum(1 for c in group
+                                     if c["status"] and 400 <= c["status"] < 500 and not c["expected"]),
+                "server_errors": sum(1 for c in group
+                                     if (not c["status"] or c["status"] >= 500) and not c["expected"]),
+                "statuses":  statuses,
+                "retries":   sum(c["retries"] for c in group),
+                "throttled": sum(c.get("throttled", 0) for c in group),
+                "bytes_out": sum(c["bytes_out"] for c in group),
+                "bytes_in":  sum(c["bytes_in"] for c in group),
+                "wait_s":    round(sum(c["wait_s"] for c in group), 4),
+                "latency_ms": {
+                    "p50":  round(percentile(latencies, 50), 2),
+                    "p95":  round(percentile(latencies, 95), 2),
+                    "max":  round(max(latencies), 2),
+                    "mean": round(sum(latencies) / len(latencies), 2),
+                },
+                "histogram_ms": histogram,
+            }
+        return {
+            "wall_s":    round(time.perf_counter() - self.started, 3),
+            "requests":  len(calls),
+            "network_s": round(sum(c["latency_s"] for c in calls), 3),
+            "wait_s":    round(sum(c["wait_s"] for c in calls), 3),
+            "throttled": sum(c.get("throttled", 0) for c in calls),
+            "cpu_s":     round(time.process_time() - self.started_cpu, 3),
+            "bytes_out": sum(c["bytes_out"] for c in calls),
+            "bytes_in":  sum(c["bytes_in"] for c in calls),
+            "endpoints": report,
+        }
+
+    def print_table(self, summary=None):
+        summary = summary or self.summary()
+        print(f"\n  {'Endpoint':<34} {'Calls':>6} {'4xx':>5} {'5xx':>5} {'p50 ms':>8} {'p95 ms':>8} "
+              f"{'Retries':>7} {'KB out':>8} {'KB in':>8}")
+        for name, e in summary["endpoints"].items():
+            print(f"  {name:<34} {e['count']:>6} {e['client_errors']:>5} {e['server_errors']:>5} "
+                  f"{e['latency_ms']['p50']:>8.1f} {e['latency_ms']['p95']:>8.1f} "
+                  f"{e['retries']:>7} {e['bytes_out'] / 1024:>8.1f} {e['bytes_in'] / 1024:>8.1f}")
+        print(f"  {summary['requests']} requests in {summary['wall_s']:.2f}s: "
+              f"{summary['network_s']:.2f}s on the network, "
+              f"{summary['wait_s']:.2f}s waiting on the rate limiter")
+        print(f"  {summary['bytes_out'] / 1024:.1f} KB sent, {summary['bytes_in'] / 1024:.1f} KB received, "
+              f"{summary['cpu_s']:.2f}s CPU")
+        if summary["throttled"]:
+            print(f"  Jira throttled {summary['throttled']} requests (429/503); "
+                  f"rate limiter settled at {LIMITER.rate:.1f} req/s")
+
+    def write_json(self, path, summary=None, **extra):
+        summary = dict(summary or self.summary(), **extra)
+        summary["generated"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+METRICS = RunMetrics()
+REQUEST_HOOKS = [METRICS.record]
+
+
+# ---------------------------------------------------------------------------
+# Profiling
+# With --profile DIR each phase of the run (project, epics and stories,
+# statuses, transitions, README) runs under cProfile and tracemalloc. DIR
+# gets, per phase, a .prof file for pstats/snakeviz and a .txt report of
+# the top functions by cumulative and own time plus the largest live
+# allocations, and summary.json has wall/CPU time and peak memory per phase.
+# cProfile follows a single thread, so threads started during a phase
+# (--workers pools, --stream stages) get a profiler each, merged into the
+# phase's report; tracemalloc covers every thread.
+# ---------------------------------------------------------------------------
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_profile")
+PROFILE_TOP = 30     # functions and allocation sites listed per report
+PROFILE_FRAMES = 5   # traceback depth tracemalloc keeps per allocation
+
+PROFILER = None  # PhaseProfiler for this run; None unless --profile is given
+
+
+class PhaseProfiler:
+    """CPU and memory profile of each phase of one run."""
+
+    def __init__(self, out_dir, top=PROFILE_TOP):
+        self.out_dir = out_dir
+        self.top = top
+        self.phases = []
+        self.lock = threading.Lock()
+        self.thread_profiles = []
+        os.makedirs(out_dir, exist_ok=True)
+
+    def _profile_thread(self, *_):
+        # Installed by threading.setprofile: swap in a profiler for this thread
+        sys.setprofile(None)
+        profile = cProfile.Profile()
+        with self.lock:
+            self.thread_profiles.append(profile)
+        profile.enable()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(PROFILE_FRAMES)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        self.thread_profiles = []
+        profile = cProfile.Profile()
+        threading.setprofile(self._profile_thread)
+        wall, cpu = time.perf_counter(), time.process_time()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            threading.setprofile(None)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            _, peak = tracemalloc.get_traced_memory()
+            self._report_phase(name, [profile] + self.thread_profiles, {
+                "phase":   name,
+                "wall_s":  round(wall, 3),
+                "cpu_s":   round(cpu, 3),
+                "peak_mb": round((peak - baseline) / 2**20, 2),
+                "threads": len(self.thread_profiles),
+            })
+
+    def _report_phase(self, name, profiles, record):
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        base = os.path.join(self.out_dir, f"{len(self.phases) + 1}-{name.replace(' ', '-')}")
+        stats.dump_stats(base + ".prof")
+
+        own_time = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+        record["hotspots"] = [
+            {"function": pstats.func_std_string(func), "own_s": round(tt, 4), "cumulative_s": round(ct, 4),
+             "calls": nc}
+            for func, (_, nc, tt, ct, _) in own_time[:5]
+        ]
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+
+        with open(base + ".txt", "w") as out:
+            out.write(f"Phase: {name}\n"
+                      f"Wall {record['wall_s']:.3f}s, CPU {record['cpu_s']:.3f}s, "
+                      f"peak {record['peak_mb']:.2f} MB above the phase's start, "
+                      f"{record['threads']} extra threads\n\n")
+            stats.stream = out
+            stats.sort_stats("cumulative").print_stats(self.top)
+            stats.sort_stats("tottime").print_stats(self.top)
+            out.write(f"Largest live allocations at the end of the phase (top {self.top})\n\n")
+            for stat in snapshot.statistics("lineno")[:self.top]:
+                out.write(f"  {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {stat.traceback}\n")
+        record["report"] = base + ".txt"
+        self.phases.append(record)
+
+    def finish(self):
+        """Stop tracing, print the per-phase table and write summary.json."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        print(f"\n  {'Phase':<20} {'Wall s':>8} {'CPU s':>8} {'Peak MB':>8}  Top function (own time)")
+        for p in self.phases:
+            top = p["hotspots"][0]["function"] if p["hotspots"] else "-"
+            print(f"  {p['phase']:<20} {p['wall_s']:>8.2f} {p['cpu_s']:>8.2f} {p['peak_mb']:>8.2f}  {top}")
+        path = os.path.join(self.out_dir, "summary.json")
+        with open(path, "w") as f:
+            json.dump({"generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                       "phases": self.phases}, f, indent=2)
+        print(f"  Profiles written to {self.out_dir}")
+
+
+def profile_phase(name):
+    """Context manager profiling one phase when --profile is on."""
+    return PROFILER.phase(name) if PROFILER is not None else contextlib.nullcontext()
+
+
+# ---------------------------------------------------------------------------
+# HTTP client
+# ---------------------------------------------------------------------------
+
+class JiraClient:
+    """Keep-alive session shared by every REST call the script makes.
+
+    Connections to the Jira site are pooled and reused, so a run pays for
+    one TLS handshake per pooled connection rather than one per request.
+    Connection errors, and 502/504 on idempotent methods, are retried at the
+    transport level with exponential backoff. Every request also passes
+    through the shared rate limiter, and 429/503 responses are retried for
+    any method, up to JIRA_THROTTLE_RETRIES times, once the limiter's backoff
+    has elapsed. Each call, retries included, is reported once to
+    REQUEST_HOOKS, with the bytes that actually crossed the wire.
+
+    With `compress`, request bodies of JIRA_GZIP_MIN bytes or more are
+    gzipped once per call; every retry resends the same bytes.
+    """
+
+    def __init__(self, base_url, auth, pool_size=JIRA_POOL_SIZE,
+                 max_retries=JIRA_MAX_RETRIES, timeouts=TIMEOUTS, limiter=None,
+                 throttle_retries=JIRA_THROTTLE_RETRIES, compress=False):
+        self.base_url = f"{base_url}/rest/api/3"
+        self.compress = compress
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.throttle_retries = throttle_retries
+        self.timeouts = timeouts
+        self.limiter = limiter or LIMITER
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(502, 504),
+            raise_on_status=False,
+            # 429/503 are left to the limiter's feedback loop below.
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                              max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.auth = auth
+        self.session.headers.update(HEADERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+
+    def timeout_for(self, path):
+        for prefix, timeout in self.timeouts:
+            if path.startswith(prefix):
+                return timeout
+        return None
+
+    def request(self, method, path, expected=(), **kwargs):
+        """Send one call. `expected` lists error statuses the caller handles."""
+        kwargs.setdefault("timeout", self.timeout_for(path))
+        if CACHE is not None and method != "GET" and not path.startswith("/search"):
+            CACHE.invalidate(path)
+        data = kwargs.get("data")
+        if isinstance(data, str):
+            data = kwargs["data"] = data.encode("utf-8")
+        if self.compress and data and len(data) >= JIRA_GZIP_MIN:
+            data = kwargs["data"] = gzip.compress(data, compresslevel=5)
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{"Content-Encoding": "gzip"})
+        call = {
+            "method":    method,
+            "endpoint":  path_template(path),
+            "status":    None,
+            "expected":  False,
+            "latency_s": 0.0,
+            "wait_s":    0.0,
+            "retries":   0,
+            "throttled": 0,
+            "bytes_out": len(data or b""),
+            "bytes_in":  0,
+        }
+        try:
+            attempt = 0
+            while True:
+                call["wait_s"] += self.limiter.acquire()
+                start = time.perf_counter()
+                r = self.session.request(method, self.base_url + path, **kwargs)
+                call["latency_s"] += time.perf_counter() - start
+                call["retries"] += len(getattr(getattr(r.raw, "retries", None), "history", ()))
+                call["status"] = r.status_code
+                call["expected"] = r.status_code in expected
+                content = r.content  # read the body so tell() counts it
+                call["bytes_in"] += r.raw.tell() if r.raw is not None else len(content)
+                delay = self.limiter.feedback(r, attempt)
+                if delay is None or attempt >= self.throttle_retries:
+                    return r
+                # The limiter has already paused every caller for `delay`;
+                # the retry is counted in the metrics rather than printed so
+                # buffered per-issue output stays in order.
+                attempt += 1
+                call["retries"] += 1
+                call["throttled"] += 1
+        finally:
+            for hook in REQUEST_HOOKS:
+                hook(call)
+
+    def connection_stats(self):
+        """Return (opened, reused) connection counts for this client."""
+        pools = self._adapter.poolmanager.pools
+        opened = sent = 0
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            sent   += pool.num_requests
+        return opened, max(sent - opened, 0)
+
+
+CLIENT = JiraClient(JIRA_BASE_URL, AUTH)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# With --cache, jira_get serves read-only endpoints from memory and from
+# .jira_cache.json for a per-endpoint TTL. Once an entry expires it is
+# revalidated with If-None-Match when Jira gave an ETag, so an unchanged
+# resource comes back as a body-less 304. Any mutating call drops the
+# cached entries for its path and the resources above and below it.
+# ---------------------------------------------------------------------------
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jira_cache.json")
+CACHE = None  # ResponseCache for this run; None unless --cache is given
+
+# Seconds a GET response stays fresh, by endpoint template; others are not cached
+CACHE_TTLS = {
+    "/myself":        24 * 3600,
+    "/project/{key}": 3600,
+}
+
+
+class ResponseCache:
+    """GET responses kept in memory and on disk, with ETags for revalidation."""
+
+    def __init__(self, path=None, site=None, ttls=None):
+        self.path = path or CACHE_PATH
+        self.site = site or JIRA_BASE_URL
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f).get(self.site, {})
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def _key(path, params):
+        return path + ("?" + "&".join(f"{k}={v}" for k, v in sorted(params.items())) if params else "")
+
+    def ttl(self, path):
+        return self.ttls.get(path_template(path), 0)
+
+    def get(self, path, params=None):
+        """Return the cached entry ({"body", "etag", "stored"}) for a GET, or None."""
+        with self.lock:
+            return self.entries.get(self._key(path, params))
+
+    def fresh(self, entry, path):
+        return time.time() - entry["stored"] < self.ttl(path)
+
+    def put(self, path, params, body, etag):
+        with self.lock:
+            self.entries[self._key(path, params)] = {"body": body, "etag": etag, "stored": time.time()}
+            self.dirty = True
+
+    def invalidate(self, path):
+        """Forget cached GETs affected by a mutation of `path`."""
+        with self.lock:
+            stale = [k for k in self.entries
+                     if k.split("?", 1)[0] == path
+                     or k.startswith(path + "/") or path.startswith(k.split("?", 1)[0] + "/")]
+            for k in stale:
+                del self.entries[k]
+            self.dirty = self.dirty or bool(stale)
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            data[self.site] = self.entries
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def jira_get(path, params=None):
-    url = f"{JIRA_BASE_URL}/rest/api/3{path}"
-    r = requests.get(url, auth=AUTH, headers=HEADERS, params=params, timeout=15)
+def json_dumps(body):
+    """Encode a request body to bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def jira_get(path, params=None, expected=()):
+    entry = None
+    if CACHE is not None and CACHE.ttl(path):
+        entry = CACHE.get(path, params)
+        if entry and CACHE.fresh(entry, path):
+            return entry["body"]
+    headers = {"If-None-Match": entry["etag"]} if entry and entry["etag"] else None
+    r = CLIENT.request("GET", path, params=params, expected=expected, headers=headers)
+    if r.status_code == 304:
+        CACHE.put(path, params, entry["body"], entry["etag"])
+        return entry["body"]
     r.raise_for_status()
-    return r.json()
+    body = json_loads(r.content)
+    if CACHE is not None and CACHE.ttl(path):
+        CACHE.put(path, params, body, r.headers.get("ETag"))
+    return body
 
 
 def jira_post(path, body):
-    url = f"{JIRA_BASE_URL}/rest/api/3{path}"
-    r = requests.post(url, auth=AUTH, headers=HEADERS,
-                      data=json.dumps(body), timeout=15)
+    r = CLIENT.request("POST", path, data=json_dumps(body))
     if not r.ok:
         print(f"  ERROR {r.status_code}: {r.text[:400]}")
         r.raise_for_status()
-    return r.json()
+    return json_loads(r.content)
+
+
+def jira_put(path, body, expected=()):
+    r = CLIENT.request("PUT", path, data=json_dumps(body), expected=expected)
+    if not r.ok:
+        if r.status_code not in expected:
+            print(f"  ERROR {r.status_code}: {r.text[:400]}")
+        r.raise_for_status()
+    return json_loads(r.content) if r.content else None
 
 
-def search_issues(jql, fields="summary,issuetype"):
-    body = {"jql": jql, "fields": fields.split(","), "maxResults": 50}
-    result = jira_post("/search/jql", body)
-    return result.get("issues", [])
+KEY_ONLY = ["id"]  # search projection for callers that only need issue keys
 
 
-def issue_exists(project_key, summary, issue_type):
-    safe = summary.replace('"', '\\"')
-    jql  = f'project = "{project_key}" AND issuetype = "{issue_type}" AND summary ~ "{safe}"'
-    hits = search_issues(jql)
-    # exact match check (~ is contains, not equals)
-    for h in hits:
-        if h["fields"]["summary"].strip() == summary.strip():
-            return h["key"]
-    return None
+def search_issues(jql, fields, page_size=50, limit=None):
+    """Yield issues matching `jql`, following nextPageToken lazily.
+
+    `fields` is a comma-separated string or a list naming exactly the
+    fields the caller reads (KEY_ONLY for none); Jira sends nothing else.
+    Paging stops after `limit` issues, so `limit=1` costs a single small
+    request.
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    body = {"jql": jql, "fields": fields, "maxResults": page_size}
+    yielded = 0
+    while True:
+        if limit is not None:
+            body["maxResults"] = min(page_size, limit - yielded)
+        result = jira_post("/search/jql", body)
+        for issue in result.get("issues", []):
+            yield issue
+            yielded += 1
+            if limit is not None and yielded >= limit:
+                return
+        token = result.get("nextPageToken")
+        if not token or result.get("isLast"):
+            return
+        body["nextPageToken"] = token
+
+
+# ---------------------------------------------------------------------------
+# Existing-issue index
+# Every epic and story the script creates carries a label derived from its
+# BOARD identity: the item's `id` when the board gives one, otherwise its
+# summary. One paginated search per project indexes those labels, so BOARD
+# items match exactly whatever characters their summaries contain, and a
+# summary edited under a fixed `id` updates the issue in place instead of
+# creating a second one. (Labels rather than entity properties, because
+# JQL can only search properties an installed app has declared indexable.)
+# Issues created before labels were added are matched once by summary and
+# tagged.
+# ---------------------------------------------------------------------------
+
+LABEL_PREFIX = "board-"
+
+_ISSUE_INDEX = {}  # {project_key: IssueIndex}
+_INDEX_LOCK  = threading.Lock()
+
+
+def normalize_summary(summary):
+    """Collapse whitespace and case so cosmetic edits still match."""
+    return " ".join(summary.split()).casefold()
+
+
+def board_label(issue_type, ident):
+    """Return the label that identifies a BOARD item in Jira."""
+    digest = hashlib.sha256(f"{issue_type}|{normalize_summary(ident)}".encode("utf-8")).hexdigest()
+    return LABEL_PREFIX + digest[:16]
+
+
+class IssueIndex:
+    """A project's epics and stories: tagged by board label, or untagged by summary."""
+
+    def __init__(self, tagged=None, untagged=None):
+        self.tagged = tagged or {}      # {label: (key, normalized summary)}
+        self.untagged = untagged or {}  # {(issue_type, normalized summary): key}
+
+    def __len__(self):
+        return len(self.tagged) + len(self.untagged)
+
+    def add(self, issue):
+        fields = issue["fields"]
+        summary = normalize_summary(fields["summary"])
+        labels = [l for l in fields.get("labels") or () if l.startswith(LABEL_PREFIX)]
+        for label in labels:
+            self.tagged.setdefault(label, (issue["key"], summary))  # oldest wins on duplicates
+        if not labels:
+            self.untagged.setdefault((fields["issuetype"]["name"], summary), issue["key"])
+
+    def lookup(self, issue_type, summary, label):
+        """Return (key, stale); stale issues need their summary or label updated."""
+        hit = self.tagged.get(label)
+        if hit:
+            return hit[0], hit[1] != normalize_summary(summary)
+        key = self.untagged.get((issue_type, normalize_summary(summary)))
+        return key, key is not None
+
+    def remember(self, label, summary, key):
+        self.tagged[label] = (key, normalize_summary(summary))
+
+    def to_json(self):
+        return {"tagged": [[l, k, s] for l, (k, s) in self.tagged.items()],
+                "untagged": [[t, s, k] for (t, s), k in self.untagged.items()]}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls({l: (k, s) for l, k, s in data["tagged"]},
+                   {(t, s): k for t, s, k in data["untagged"]})
+
+
+def index_jql(project_key):
+    return f'project = "{project_key}" AND issuetype in (Epic, Story) ORDER BY created ASC'
+
+
+def load_issue_index(project_key):
+    """Page through every epic and story in the project once."""
+    index = IssueIndex()
+    for h in search_issues(index_jql(project_key), fields="summary,issuetype,labels", page_size=100):
+        index.add(h)
+    return index
+
+
+def issue_index(project_key):
+    with _INDEX_LOCK:
+        if project_key not in _ISSUE_INDEX:
+            index = JOURNAL and JOURNAL.replayed_index(project_key)
+            if index is not None:
+                print(f"  Replayed index of {len(index)} epics/stories in {project_key} from the run journal")
+            else:
+                index = load_issue_index(project_key)
+                print(f"  Indexed {len(index)} existing epics/stories in {project_key}")
+                if JOURNAL is not None:
+                    JOURNAL.settle(project_key, index)
+                    JOURNAL.index(project_key, index)
+            _ISSUE_INDEX[project_key] = index
+        return _ISSUE_INDEX[project_key]
+
+
+def issue_exists(project_key, summary, issue_type, label=None):
+    """Return (key, stale) for a BOARD item, or (None, False) if it is missing."""
+    return issue_index(project_key).lookup(issue_type, summary, label or board_label(issue_type, summary))
+
+
+def remember_issue(project_key, summary, label, key):
+    """Record an issue created during this run so later lookups see it."""
+    issue_index(project_key).remember(label, summary, key)
+
+
+def adopt_existing(project_key, issue_type, fields, log=print):
+    """Return the key of the issue already holding this BOARD item, or None.
+
+    An issue found under the item's label with an older summary is renamed,
+    and one found only by summary is tagged with the label, in one PUT.
+    """
+    label = fields["labels"][0]
+    existing, stale = issue_exists(project_key, fields["summary"], issue_type, label)
+    if not existing:
+        return None
+    indent = "    " if issue_type == "Epic" else "      "
+    if stale:
+        jira_put(f"/issue/{existing}", {
+            "fields": {"summary": fields["summary"], "description": fields["description"]},
+            "update": {"labels": [{"add": label}]},
+        })
+        remember_issue(project_key, fields["summary"], label, existing)
+        log(f"{indent}Updated {issue_type.lower()}: {existing}  \"{fields['summary']}\"")
+    else:
+        log(f"{indent}{issue_type} already exists: {existing}  \"{fields['summary']}\"")
+    record_synced(project_key, issue_type, existing, fields)
+    return existing
 
 
 def get_account_id():
@@ -286,9 +1300,28 @@ def get_account_id():
     return me["accountId"]
 
 
+class AdfDoc(dict):
+    """An ADF document, built once per distinct text and treated as read-only.
+
+    The builders below are memoized, so a board item rebuilt for a retry,
+    a bulk fallback or a resumed run gets the same object back, and its
+    canonical JSON (what content_hash digests) is rendered only once.
+    """
+
+    __slots__ = ("_canonical",)
+
+    def canonical(self):
+        try:
+            return self._canonical
+        except AttributeError:
+            self._canonical = json.dumps(self, sort_keys=True, separators=(",", ":"))
+            return self._canonical
+
+
+@functools.lru_cache(maxsize=4096)
 def adf_doc(text):
     """Wrap plain text as an Atlassian Document Format doc."""
-    return {
+    return AdfDoc({
         "type": "doc",
         "version": 1,
         "content": [
@@ -297,11 +1330,16 @@ def adf_doc(text):
                 "content": [{"type": "text", "text": text}],
             }
         ],
-    }
+    })
 
 
 def adf_acceptance_criteria(lines):
     """Build an ADF doc with an AC heading and a bullet list."""
+    return _adf_acceptance_criteria(tuple(lines))
+
+
+@functools.lru_cache(maxsize=4096)
+def _adf_acceptance_criteria(lines):
     items = [
         {
             "type": "listItem",
@@ -314,7 +1352,7 @@ def adf_acceptance_criteria(lines):
         }
         for line in lines
     ]
-    return {
+    return AdfDoc({
         "type": "doc",
         "version": 1,
         "content": [
@@ -325,107 +1363,1686 @@ def adf_acceptance_criteria(lines):
             },
             {"type": "bulletList", "content": items},
         ],
-    }
+    })
 
 
 # ---------------------------------------------------------------------------
-# Project creation
+# Sync manifest
+# A JSON file next to this script remembers the key and a content hash of
+# every issue it has synced, by board label, per site and project. Unchanged
+# BOARD items are skipped without any API call; edited ones get a single
+# PUT /issue/{key}.
 # ---------------------------------------------------------------------------
 
-def get_or_create_project():
-    # Check if project key already exists
-    try:
-        proj = jira_get(f"/project/{PROJECT_KEY}")
-        print(f"  Project {PROJECT_KEY} already exists: {proj['name']}")
-        return proj["key"], proj["id"]
-    except requests.HTTPError as e:
-        if e.response.status_code != 404:
-            raise
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jira_sync.json")
+MANIFEST = None  # SyncManifest for this run; None when --no-manifest is given
 
-    print(f"  Creating project {PROJECT_KEY} ...")
-    account_id = get_account_id()
 
-    body = {
-        "key":         PROJECT_KEY,
-        "name":        PROJECT_NAME,
-        "description": PROJECT_DESC,
-        "projectTypeKey":     "software",
-        "projectTemplateKey": "com.pyxis.greenhopper.jira:gh-simplified-kanban-classic",
-        "leadAccountId":      account_id,
-        "assigneeType":       "UNASSIGNED",
-    }
+def content_hash(fields):
+    """Hash the parts of an issue that BOARD controls."""
+    description = fields["description"]
+    if isinstance(description, AdfDoc):
+        description = description.canonical()
+    else:
+        description = json.dumps(description, sort_keys=True, separators=(",", ":"))
+    # Same bytes as json.dumps of {"summary", "description"} with sorted keys
+    rendered = '{"description":%s,"summary":%s}' % (description, json.dumps(fields["summary"]))
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()
 
-    result = jira_post("/project", body)
-    print(f"  Created: {result['key']} (id={result['id']})")
-    return result["key"], str(result["id"])
 
+class SyncManifest:
+    """Issue keys and content hashes recorded by previous runs."""
 
-# ---------------------------------------------------------------------------
-# Epic + story creation
-# ---------------------------------------------------------------------------
+    def __init__(self, path=None, site=None):
+        self.path = path or MANIFEST_PATH
+        self.site = site or JIRA_BASE_URL
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            with open(self.path) as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = {}
+        except ValueError:
+            print(f"  Ignoring unreadable sync manifest {self.path}")
+            self.data = {}
+        self.data.setdefault("version", 2)
+        self.data.setdefault("sites", {})
+        if self.data["version"] == 1:
+            self._upgrade_v1()
 
-def get_or_create_epic(project_key, summary, description):
-    existing = issue_exists(project_key, summary, "Epic")
-    if existing:
-        print(f"    Epic already exists: {existing}  \"{summary}\"")
-        return existing
+    def _upgrade_v1(self):
+        """Re-key version 1 entries ("Type|summary") by board label.
 
-    body = {
-        "fields": {
-            "project":     {"key": project_key},
-            "summary":     summary,
-            "description": adf_doc(description),
-            "issuetype":   {"name": "Epic"},
-        }
-    }
-    result = jira_post("/issue", body)
-    key = result["key"]
-    print(f"    Created epic: {key}  \"{summary}\"")
-    time.sleep(0.3)
-    return key
+        Their issues predate labels, so the hash is cleared to have the next
+        run tag each of them with one PUT.
+        """
+        for projects in self.data["sites"].values():
+            for project in projects.values():
+                project["issues"] = {
+                    board_label(*ident.split("|", 1)): {"key": entry["key"], "hash": ""}
+                    for ident, entry in project["issues"].items()
+                }
+        self.data["version"] = 2
+        self.dirty = True
 
+    def project(self, project_key):
+        sites = self.data["sites"].setdefault(self.site, {})
+        return sites.setdefault(project_key, {"issues": {}})
 
-def get_or_create_story(project_key, epic_key, summary, ac_lines):
-    existing = issue_exists(project_key, summary, "Story")
-    if existing:
-        print(f"      Story already exists: {existing}  \"{summary}\"")
-        return existing
+    def replace_project(self, project_key, entry):
+        """Store a whole project subtree, e.g. one returned by a --projects worker."""
+        with self.lock:
+            self.data["sites"].setdefault(self.site, {})[project_key] = entry
+            self.dirty = True
 
-    body = {
-        "fields": {
-            "project":     {"key": project_key},
-            "summary":     summary,
-            "description": adf_acceptance_criteria(ac_lines),
-            "issuetype":   {"name": "Story"},
-            "parent":      {"key": epic_key},
-        }
-    }
-    result = jira_post("/issue", body)
-    key = result["key"]
-    print(f"      Created story: {key}  \"{summary}\"")
-    time.sleep(0.3)
-    return key
+    def get(self, project_key, label):
+        with self.lock:
+            return self.project(project_key)["issues"].get(label)
 
+    def record(self, project_key, label, key, digest):
+        with self.lock:
+            self.project(project_key)["issues"][label] = {"key": key, "hash": digest}
+            self.dirty = True
 
-# ---------------------------------------------------------------------------
-# Transition ID discovery
-# ---------------------------------------------------------------------------
+    def forget(self, project_key, label):
+        with self.lock:
+            self.project(project_key)["issues"].pop(label, None)
+            self.dirty = True
 
-def get_transition_ids(project_key):
-    """Return a dict of {transition_name: id} for the first issue found."""
-    issues = search_issues(f'project = "{project_key}"', fields="summary")
-    if not issues:
-        return {}
-    issue_key = issues[0]["key"]
-    data = jira_get(f"/issue/{issue_key}/transitions")
-    return {t["name"]: t["id"] for t in data.get("transitions", [])}
+    def get_entry(self, project_key, name, entry):
+        with self.lock:
+            return self.project(project_key).get(name, {}).get(entry)
+
+    def set_entry(self, project_key, name, entry, value):
+        with self.lock:
+            self.project(project_key).setdefault(name, {})[entry] = value
+            self.dirty = True
+
+    def set_value(self, project_key, name, value):
+        with self.lock:
+            self.project(project_key)[name] = value
+            self.dirty = True
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(self.data, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+            self.dirty = False
+
+
+def sync_from_manifest(project_key, issue_type, fields, log=print):
+    """Return the issue's key if the manifest already covers it, else None.
+
+    Unchanged issues cost nothing; changed ones are updated in place.
+    """
+    if MANIFEST is None:
+        return None
+    summary, label = fields["summary"], fields["labels"][0]
+    entry = MANIFEST.get(project_key, label)
+    if entry is None:
+        return None
+
+    key, digest = entry["key"], content_hash(fields)
+    indent = "    " if issue_type == "Epic" else "      "
+    if entry["hash"] == digest:
+        log(f"{indent}{issue_type} unchanged: {key}  \"{summary}\"")
+        return key
+
+    update = {"summary": summary, "description": fields["description"]}
+    try:
+        jira_put(f"/issue/{key}", {"fields": update, "update": {"labels": [{"add": label}]}},
+                 expected=(404,))
+    except requests.HTTPError as e:
+        if e.response.status_code != 404:
+            raise
+        # Deleted in Jira since the last run: fall back to lookup/create
+        MANIFEST.forget(project_key, label)
+        return None
+    MANIFEST.record(project_key, label, key, digest)
+    log(f"{indent}Updated {issue_type.lower()}: {key}  \"{summary}\"")
+    return key
+
+
+def record_synced(project_key, issue_type, key, fields):
+    if MANIFEST is not None:
+        MANIFEST.record(project_key, fields["labels"][0], key, content_hash(fields))
 
 
 # ---------------------------------------------------------------------------
-# README generation
+# Write-ahead journal
+# Every create is appended to .jira_journal.jsonl (and fsynced) before its
+# request goes out, and its key is appended once Jira answers. The journal
+# also keeps the project id and the issue index the run started from. If the
+# run dies, the next one replays the journal instead of re-checking the
+# project and re-searching the index; only creates that were sent but never
+# confirmed are looked up in Jira, one targeted search each. A run that
+# finishes deletes its journal.
 # ---------------------------------------------------------------------------
 
+JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jira_journal.jsonl")
+JOURNAL = None  # Journal for this run; None outside run_setup()
+
+
+class Journal:
+    """Append-only record of one run's progress, replayed after a crash."""
+
+    def __init__(self, path=None, site=None):
+        self.path = path or JOURNAL_PATH
+        self.site = site or JIRA_BASE_URL
+        self.lock = threading.Lock()
+        self.projects = {}  # {project_key: project_id}
+        self.indexes = {}   # {project_key: IssueIndex}
+        self.created = {}   # {project_key: {label: (key, summary)}}
+        self.pending = {}   # {op: (project_key, label, summary)}, sent but unconfirmed
+        self.next_op = 0
+        self.resumed = self._replay()
+        self.file = open(self.path, "a" if self.resumed else "w")
+        if not self.resumed:
+            self._write([{"op": "begin", "site": self.site}])
+
+    def _replay(self):
+        try:
+            with open(self.path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return False
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break  # torn final write
+        if not records or records[0] != {"op": "begin", "site": self.site}:
+            return False
+
+        for rec in records[1:]:
+            op = rec["op"]
+            if op == "project":
+                self.projects[rec["project"]] = rec["id"]
+            elif op == "index":
+                self.indexes[rec["project"]] = IssueIndex.from_json(rec["issues"])
+            elif op == "intent":
+                self.pending[rec["id"]] = (rec["project"], rec["label"], rec["summary"])
+                self.next_op = max(self.next_op, rec["id"] + 1)
+            elif op == "done":
+                project_key, label, summary = self.pending.pop(rec["id"])
+                self.created.setdefault(project_key, {})[label] = (rec["key"], summary)
+            elif op == "failed":
+                self.pending.pop(rec["id"], None)
+        return True
+
+    def _write(self, records, durable=False):
+        with self.lock:
+            for rec in records:
+                self.file.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self.file.flush()
+            if durable:
+                os.fsync(self.file.fileno())
+
+    def project(self, project_key, project_id):
+        self._write([{"op": "project", "project": project_key, "id": project_id}])
+
+    def index(self, project_key, index):
+        self._write([{"op": "index", "project": project_key, "issues": index.to_json()}])
+
+    def intents(self, fields_list):
+        """Record creates about to be sent; return their op ids."""
+        with self.lock:
+            ops = list(range(self.next_op, self.next_op + len(fields_list)))
+            self.next_op += len(fields_list)
+        self._write([
+            {"op": "intent", "id": op, "project": f["project"]["key"],
+             "label": f["labels"][0], "summary": f["summary"]}
+            for op, f in zip(ops, fields_list)
+        ], durable=True)
+        return ops
+
+    def done(self, op, key):
+        # Not fsynced: a lost "done" only turns into one targeted lookup
+        self._write([{"op": "done", "id": op, "key": key}])
+
+    def failed(self, op):
+        self._write([{"op": "failed", "id": op}])
+
+    def replayed_index(self, project_key):
+        """Return the journaled index with in-doubt creates resolved, or None."""
+        if project_key not in self.indexes:
+            return None
+        index = self.indexes[project_key]
+        for label, (key, summary) in self.created.get(project_key, {}).items():
+            index.remember(label, summary, key)
+        for op, (pk, label, summary) in sorted(self.pending.items()):
+            if pk != project_key:
+                continue
+            key = find_issue(project_key, label)
+            print(f"  In doubt from the last run: \"{summary}\" → {key or 'not created'}")
+            if key:
+                index.remember(label, summary, key)
+                self.done(op, key)
+            else:
+                self.failed(op)
+            del self.pending[op]
+        return index
+
+    def settle(self, project_key, index):
+        """Resolve unconfirmed creates against a freshly searched index."""
+        for op, (pk, label, _) in list(self.pending.items()):
+            if pk == project_key:
+                key = index.tagged.get(label, (None,))[0]
+                self.done(op, key) if key else self.failed(op)
+                del self.pending[op]
+
+    def close(self):
+        self.file.close()
+
+    def finish(self):
+        """The run completed: nothing left to resume."""
+        self.close()
+        os.remove(self.path)
+
+
+def find_issue(project_key, label):
+    """Targeted lookup of one BOARD item by its label."""
+    jql = f'project = "{project_key}" AND labels = "{label}" ORDER BY created ASC'
+    first = next(search_issues(jql, fields=KEY_ONLY, limit=1), None)
+    return first and first["key"]
+
+
+CREATED_KEYS = []  # keys of the issues this run created, for --projects reports
+
+
+def create_issue(fields):
+    """POST one issue, journaled so an interrupted run knows it was sent."""
+    op = JOURNAL.intents([fields])[0] if JOURNAL else None
+    try:
+        result = jira_post("/issue", {"fields": fields})
+    except requests.HTTPError as e:
+        # Jira answered with a client error, so nothing was created
+        if op is not None and e.response is not None and e.response.status_code < 500:
+            JOURNAL.failed(op)
+        raise
+    if op is not None:
+        JOURNAL.done(op, result["key"])
+    CREATED_KEYS.append(result["key"])
+    return result["key"]
+
+
+# ---------------------------------------------------------------------------
+# Project creation
+# ---------------------------------------------------------------------------
+
+def known_project():
+    """Return PROJECT_KEY's id from the manifest or journal, without a request."""
+    if MANIFEST is not None:
+        # Trusted for as long as a cached /project response would be
+        recorded = MANIFEST.project(PROJECT_KEY)
+        known, checked = recorded.get("project_id"), recorded.get("project_checked", 0)
+        if known and time.time() - checked < CACHE_TTLS["/project/{key}"]:
+            print(f"  Project {PROJECT_KEY} recorded in sync manifest (id={known})")
+            return known
+    if JOURNAL is not None and PROJECT_KEY in JOURNAL.projects:
+        known = JOURNAL.projects[PROJECT_KEY]
+        print(f"  Project {PROJECT_KEY} recorded in run journal (id={known})")
+        return known
+    return None
+
+
+def find_project():
+    """Return PROJECT_KEY's id if the project exists, else None; creates nothing."""
+    known = known_project()
+    if known:
+        return known
+
+    # Check if project key already exists
+    try:
+        proj = jira_get(f"/project/{PROJECT_KEY}", expected=(404,))
+        print(f"  Project {PROJECT_KEY} already exists: {proj['name']}")
+        remember_project(proj["key"], proj["id"])
+        return proj["id"]
+    except requests.HTTPError as e:
+        if e.response.status_code != 404:
+            raise
+    return None
+
+
+def get_or_create_project():
+    known = find_project()
+    if known:
+        return PROJECT_KEY, known
+
+    print(f"  Creating project {PROJECT_KEY} ...")
+    result = jira_post("/project", project_body(get_account_id()))
+    print(f"  Created: {result['key']} (id={result['id']})")
+    remember_project(result["key"], str(result["id"]))
+    return result["key"], str(result["id"])
+
+
+def project_body(account_id):
+    return {
+        "key":         PROJECT_KEY,
+        "name":        PROJECT_NAME,
+        "description": PROJECT_DESC,
+        "projectTypeKey":     "software",
+        "projectTemplateKey": "com.pyxis.greenhopper.jira:gh-simplified-kanban-classic",
+        "leadAccountId":      account_id,
+        "assigneeType":       "UNASSIGNED",
+    }
+
+
+def remember_project(project_key, project_id):
+    if MANIFEST is not None:
+        MANIFEST.set_value(project_key, "project_id", project_id)
+        MANIFEST.set_value(project_key, "project_checked", time.time())
+    if JOURNAL is not None:
+        JOURNAL.project(project_key, project_id)
+
+
+# ---------------------------------------------------------------------------
+# Epic + story creation
+# ---------------------------------------------------------------------------
+
+def get_or_create_epic(project_key, summary, description, log=print, ident=None):
+    fields = epic_fields(project_key, summary, description, ident)
+    synced = sync_from_manifest(project_key, "Epic", fields, log)
+    if synced:
+        return synced
+
+    existing = adopt_existing(project_key, "Epic", fields, log)
+    if existing:
+        return existing
+
+    key = create_issue(fields)
+    remember_issue(project_key, summary, fields["labels"][0], key)
+    record_synced(project_key, "Epic", key, fields)
+    log(f"    Created epic: {key}  \"{summary}\"")
+    return key
+
+
+def get_or_create_story(project_key, epic_key, summary, ac_lines, log=print, ident=None):
+    fields = story_fields(project_key, epic_key, summary, ac_lines, ident)
+    synced = sync_from_manifest(project_key, "Story", fields, log)
+    if synced:
+        return synced
+
+    existing = adopt_existing(project_key, "Story", fields, log)
+    if existing:
+        return existing
+
+    key = create_issue(fields)
+    remember_issue(project_key, summary, fields["labels"][0], key)
+    record_synced(project_key, "Story", key, fields)
+    log(f"      Created story: {key}  \"{summary}\"")
+    return key
+
+
+def epic_fields(project_key, summary, description, ident=None):
+    """`ident` is the BOARD item's stable id; it defaults to the summary."""
+    return {
+        "project":     {"key": project_key},
+        "summary":     summary,
+        "description": adf_doc(description),
+        "issuetype":   {"name": "Epic"},
+        "labels":      [board_label("Epic", ident or summary)],
+    }
+
+
+def story_fields(project_key, epic_key, summary, ac_lines, ident=None):
+    return {
+        "project":     {"key": project_key},
+        "summary":     summary,
+        "description": adf_acceptance_criteria(ac_lines),
+        "issuetype":   {"name": "Story"},
+        "parent":      {"key": epic_key},
+        "labels":      [board_label("Story", ident or summary)],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Concurrent creation
+# The only ordering constraint on BOARD is that a story needs its parent
+# epic's key, so every epic is submitted at once and each epic's stories are
+# queued as soon as that key comes back. Output is buffered per issue and
+# printed grouped per epic in BOARD order, whatever order the calls finish in.
+# ---------------------------------------------------------------------------
+
+def create_board_concurrent(project_key, workers):
+    """Create BOARD on a pool of `workers` threads; return {epic_summary: epic_key}."""
+    epic_logs  = [[] for _ in BOARD]
+    story_logs = [[[] for _ in block["stories"]] for block in BOARD]
+    epic_keys  = [None] * len(BOARD)
+    story_futures = [[] for _ in BOARD]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        epic_futures = {
+            pool.submit(get_or_create_epic, project_key, block["epic_summary"],
+                        block["epic_description"], epic_logs[i].append, block.get("epic_id")): i
+            for i, block in enumerate(BOARD)
+        }
+        for future in as_completed(epic_futures):
+            i = epic_futures[future]
+            epic_keys[i] = future.result()
+            story_futures[i] = [
+                pool.submit(get_or_create_story, project_key, epic_keys[i],
+                            story_summary, ac_lines, story_logs[i][j].append,
+                            story_id(BOARD[i], story_summary))
+                for j, (story_summary, ac_lines) in enumerate(BOARD[i]["stories"])
+            ]
+
+        # Print each epic's group once it and everything before it is done
+        for i, block in enumerate(BOARD):
+            print(f"\n  Epic: {block['epic_summary']}")
+            for line in epic_logs[i]:
+                print(line)
+            for j, future in enumerate(story_futures[i]):
+                future.result()
+                for line in story_logs[i][j]:
+                    print(line)
+
+    return {block["epic_summary"]: epic_keys[i] for i, block in enumerate(BOARD)}
+
+
+# ---------------------------------------------------------------------------
+# Bulk story creation
+# POST /issue/bulk accepts up to 50 issues per request and reports failures
+# per element, so one rejected story does not sink the rest of its chunk.
+# ---------------------------------------------------------------------------
+
+BULK_CHUNK = 50
+
+
+def create_issues_bulk(fields_list):
+    """Create issues in chunks; return [(key, error)] in input order."""
+    results = []
+    for start in range(0, len(fields_list), BULK_CHUNK):
+        chunk = fields_list[start:start + BULK_CHUNK]
+        body = {"issueUpdates": [{"fields": f} for f in chunk]}
+        ops = JOURNAL.intents(chunk) if JOURNAL else []
+        r = CLIENT.request("POST", "/issue/bulk", data=json_dumps(body))
+        # A 400 can mean every element failed (the body lists each one) or
+        # that the request itself was rejected; only the first is per-element.
+        if not r.ok and r.status_code != 400:
+            print(f"  ERROR {r.status_code}: {r.text[:400]}")
+            r.raise_for_status()
+        result = json_loads(r.content) if r.content else {}
+
+        failed = {}
+        for err in result.get("errors", []):
+            element = err.get("elementErrors", {})
+            messages = element.get("errorMessages", []) + [
+                f"{field}: {msg}" for field, msg in element.get("errors", {}).items()
+            ]
+            failed[err["failedElementNumber"]] = "; ".join(messages) or f"HTTP {err.get('status')}"
+
+        issues = result.get("issues", [])
+        if len(failed) + len(issues) != len(chunk):
+            print(f"  ERROR {r.status_code}: bulk create of {len(chunk)} issues returned "
+                  f"{len(issues)} created and {len(failed)} failed: {r.text[:400]}")
+            if r.status_code == 400:
+                for op in ops:
+                    JOURNAL.failed(op)
+            r.raise_for_status()
+            raise RuntimeError("Bulk create response does not account for every submitted issue")
+
+        # Created issues come back in submission order, minus the failures
+        created = iter(issues)
+        for i in range(len(chunk)):
+            if i in failed:
+                results.append((None, failed[i]))
+                if ops:
+                    JOURNAL.failed(ops[i])
+            else:
+                results.append((next(created)["key"], None))
+                CREATED_KEYS.append(results[-1][0])
+                if ops:
+                    JOURNAL.done(ops[i], results[-1][0])
+    return results
+
+
+def create_board_bulk(project_key):
+    """Create epics one by one, then every missing story through /issue/bulk.
+
+    Returns {epic_summary: epic_key}, like the sequential path in main().
+    """
+    epics_map = {}
+    for block in BOARD:
+        print(f"\n  Epic: {block['epic_summary']}")
+        epics_map[block["epic_summary"]] = get_or_create_epic(
+            project_key,
+            block["epic_summary"],
+            block["epic_description"],
+            ident=block.get("epic_id"),
+        )
+
+    # Collect the stories that are missing across all epics
+    outcome = {}  # {(epic_summary, story_summary): [log lines]}
+    pending = []  # [(epic_summary, story_summary, fields)]
+    for block in BOARD:
+        epic_key = epics_map[block["epic_summary"]]
+        for story_summary, ac_lines in block["stories"]:
+            lines = outcome[(block["epic_summary"], story_summary)] = []
+            fields = story_fields(project_key, epic_key, story_summary, ac_lines,
+                                  story_id(block, story_summary))
+            if sync_from_manifest(project_key, "Story", fields, lines.append):
+                continue
+            if not adopt_existing(project_key, "Story", fields, lines.append):
+                pending.append((block["epic_summary"], story_summary, fields))
+
+    if pending:
+        print(f"\n  Submitting {len(pending)} stories in chunks of {BULK_CHUNK} ...")
+    results = create_issues_bulk([fields for _, _, fields in pending])
+    failures = 0
+    for (epic_summary, story_summary, fields), (key, error) in zip(pending, results):
+        lines = outcome[(epic_summary, story_summary)]
+        if key:
+            remember_issue(project_key, story_summary, fields["labels"][0], key)
+            record_synced(project_key, "Story", key, fields)
+            lines.append(f"      Created story: {key}  \"{story_summary}\"")
+        else:
+            failures += 1
+            lines.append(f"      FAILED story: \"{story_summary}\" — {error}")
+
+    # Report grouped per epic in BOARD order
+    for block in BOARD:
+        print(f"\n  Stories for {epics_map[block['epic_summary']]}  \"{block['epic_summary']}\"")
+        for story_summary, _ in block["stories"]:
+            for line in outcome[(block["epic_summary"], story_summary)]:
+                print(line)
+    if failures:
+        print(f"\n  {failures} stories were rejected; fix them in BOARD and re-run.")
+    return epics_map
+
+
+# ---------------------------------------------------------------------------
+# Streaming pipeline
+# With --stream, BOARD items flow through stages that each run on their own
+# thread, joined by bounded queues:
+#
+#     load → resolve → build → submit → record
+#
+# load yields an item per epic followed by its stories; resolve gets each
+# epic's key (creating it if need be), which its stories need as parent;
+# build makes the story payloads; submit skips or updates known stories and
+# creates the rest, through /issue/bulk with --bulk; record, in the main
+# thread, reports each result and collects the epic keys for the README as
+# they arrive. At most PIPELINE_DEPTH items wait between two stages, so when
+# Jira slows down submit blocks, the queues fill and loading pauses. With a
+# .jsonl board, which is read a line at a time, memory stays flat however
+# large the board is.
+# ---------------------------------------------------------------------------
+
+PIPELINE_DEPTH = 2 * BULK_CHUNK
+_END = object()  # end-of-stream marker between stages
+
+
+def _put(q, item, stop):
+    """Put `item` on `q`, waiting while it is full; False once the pipeline stops."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _drain(q, stop):
+    while not stop.is_set():
+        try:
+            item = q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is _END:
+            return
+        yield item
+
+
+def pipeline(source, *stages, depth=PIPELINE_DEPTH):
+    """Yield the items of `source` after each generator stage has processed them.
+
+    `source` and every stage run on their own threads. The first one to
+    raise stops the others, and its error is re-raised here.
+    """
+    stop = threading.Event()
+    errors = []
+    queues = [queue.Queue(maxsize=depth) for _ in range(len(stages) + 1)]
+
+    def pump(items, out):
+        try:
+            for item in items:
+                if not _put(out, item, stop):
+                    return
+            _put(out, _END, stop)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+
+    feeds = [source] + [stage(_drain(q, stop)) for stage, q in zip(stages, queues)]
+    threads = [threading.Thread(target=pump, args=(items, out), daemon=True)
+               for items, out in zip(feeds, queues)]
+    for t in threads:
+        t.start()
+    try:
+        yield from _drain(queues[-1], stop)
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+    if errors:
+        raise errors[0]
+
+
+def load_items(board):
+    """load: an item per epic, then one per story in it."""
+    for block in board:
+        yield {"type": "Epic", "block": block, "summary": block["epic_summary"], "lines": []}
+        for story_summary, ac_lines in block["stories"]:
+            yield {"type": "Story", "block": block, "summary": story_summary,
+                   "ac": ac_lines, "lines": []}
+
+
+def resolve_items(project_key, items):
+    """resolve: give each epic its key and each story its parent's."""
+    epic_key = None
+    for item in items:
+        block = item["block"]
+        if item["type"] == "Epic":
+            epic_key = item["key"] = get_or_create_epic(
+                project_key, item["summary"], block["epic_description"],
+                item["lines"].append, block.get("epic_id"))
+        else:
+            item["epic_key"] = epic_key
+        yield item
+
+
+def build_items(project_key, items):
+    """build: the create payload for each story."""
+    for item in items:
+        if item["type"] == "Story":
+            item["fields"] = story_fields(project_key, item["epic_key"], item["summary"],
+                                          item["ac"], story_id(item["block"], item["summary"]))
+        yield item
+
+
+def submit_items(project_key, bulk, items):
+    """submit: skip or update known stories, create the rest.
+
+    Items are passed on in order, so with --bulk they are held back until
+    BULK_CHUNK creates have gathered (or PIPELINE_DEPTH items in all) and
+    those creates are sent as one request.
+    """
+    window, pending = [], []
+    for item in items:
+        if item["type"] == "Story":
+            fields, log = item["fields"], item["lines"].append
+            if not (sync_from_manifest(project_key, "Story", fields, log)
+                    or adopt_existing(project_key, "Story", fields, log)):
+                item["created"] = True
+                if bulk:
+                    pending.append(item)
+                else:
+                    item["key"] = create_issue(fields)
+        window.append(item)
+        if len(pending) >= BULK_CHUNK or len(window) >= PIPELINE_DEPTH:
+            yield from _submit_window(window, pending)
+            window, pending = [], []
+    yield from _submit_window(window, pending)
+
+
+def _submit_window(window, pending):
+    results = create_issues_bulk([item["fields"] for item in pending])
+    for item, (key, error) in zip(pending, results):
+        item["key"], item["error"] = key, error
+    yield from window
+
+
+def create_board_streamed(project_key, board, bulk):
+    """Create `board` through the pipeline; return {epic_summary: epic_key}."""
+    epics_map = {}  # the README's input, filled in as epics are recorded
+    stories = created = failures = 0
+    stages = (partial(resolve_items, project_key), partial(build_items, project_key),
+              partial(submit_items, project_key, bulk))
+    for item in pipeline(load_items(board), *stages):
+        # record
+        if item["type"] == "Epic":
+            epics_map[item["summary"]] = item["key"]
+            print(f"\n  Epic: {item['summary']}")
+        elif item.get("created"):
+            stories += 1
+            fields = item["fields"]
+            if item.get("key"):
+                created += 1
+                remember_issue(project_key, item["summary"], fields["labels"][0], item["key"])
+                record_synced(project_key, "Story", item["key"], fields)
+                item["lines"].append(f"      Created story: {item['key']}  \"{item['summary']}\"")
+            else:
+                failures += 1
+                item["lines"].append(f"      FAILED story: \"{item['summary']}\" — {item['error']}")
+        else:
+            stories += 1
+        for line in item["lines"]:
+            print(line)
+
+    print(f"\n  {len(epics_map)} epics and {stories} stories streamed; {created} stories created")
+    if failures:
+        print(f"\n  {failures} stories were rejected; fix them in the board and re-run.")
+    return epics_map
+
+
+# ---------------------------------------------------------------------------
+# Plan and apply
+# --plan works out what a run would change without sending any mutating
+# request. It costs one GET /project (none while the sync manifest's record
+# of the project is fresh) and, if the project exists, the single paginated
+# search behind the issue index. Each BOARD item is then classified the way
+# a run would treat it:
+#
+#     + create   no issue carries its label (or, untagged, its summary)
+#     ~ update   renamed, not yet tagged, or edited since the last sync
+#     = no-op    already up to date
+#
+# The plan is saved as JSON with the full payload of every change, and
+# --apply PATH carries it out later as written, without recomputing it.
+# Stories planned under a new epic get the epic's key once it is created.
+# ---------------------------------------------------------------------------
+
+PLAN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_plan.json")
+PLAN_VERSION = 1
+PLAN_SYMBOLS = {"create": "+", "update": "~", "noop": "="}
+
+
+def plan_item(project_key, issue_type, fields, index):
+    """Return the plan entry for one BOARD item; `index` is None for a new project."""
+    label = fields["labels"][0]
+    item = {"type": issue_type, "label": label, "summary": fields["summary"], "fields": fields}
+    key, stale = index.lookup(issue_type, fields["summary"], label) if index else (None, False)
+    entry = MANIFEST.get(project_key, label) if MANIFEST is not None else None
+    if key is None:
+        return dict(item, action="create")
+    if entry and entry["key"] == key and entry["hash"] != content_hash(fields):
+        return dict(item, action="update", key=key, reason="edited since the last sync")
+    if stale:
+        reason = "renamed" if label in index.tagged else "tag with its board label"
+        return dict(item, action="update", key=key, reason=reason)
+    return dict(item, action="noop", key=key)
+
+
+def make_plan(project_id):
+    """Classify every BOARD item against PROJECT_KEY; return the plan."""
+    index = issue_index(PROJECT_KEY) if project_id else None
+    items = []
+    for block in BOARD:
+        fields = epic_fields(PROJECT_KEY, block["epic_summary"], block["epic_description"],
+                             block.get("epic_id"))
+        epic = plan_item(PROJECT_KEY, "Epic", fields, index)
+        items.append(epic)
+        for story_summary, ac_lines in block["stories"]:
+            fields = story_fields(PROJECT_KEY, epic.get("key"), story_summary, ac_lines,
+                                  story_id(block, story_summary))
+            items.append(dict(plan_item(PROJECT_KEY, "Story", fields, index), parent=epic["label"]))
+    return {
+        "version":   PLAN_VERSION,
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "site":      JIRA_BASE_URL,
+        "project":   {"key": PROJECT_KEY, "name": PROJECT_NAME, "description": PROJECT_DESC,
+                      "id": project_id, "action": "noop" if project_id else "create"},
+        "items":     items,
+    }
+
+
+def print_plan(plan):
+    project = plan["project"]
+    print(f"\n  {PLAN_SYMBOLS[project['action']]} Project {project['key']}  \"{project['name']}\"")
+    counts = {action: 0 for action in PLAN_SYMBOLS}
+    for item in plan["items"]:
+        counts[item["action"]] += 1
+        indent = "    " if item["type"] == "Epic" else "      "
+        key = f"{item['key']}  " if item.get("key") else ""
+        reason = f"  ({item['reason']})" if item.get("reason") else ""
+        print(f"{indent}{PLAN_SYMBOLS[item['action']]} {item['type']} {key}\"{item['summary']}\"{reason}")
+    print(f"\n  Plan: {counts['create']} to create, {counts['update']} to update, "
+          f"{counts['noop']} unchanged")
+
+
+def run_plan(args):
+    print("=== AccessVBA → Azure SQL Migration — Jira Setup (plan) ===\n")
+    project_id = find_project()
+    if not project_id:
+        print(f"  Project {PROJECT_KEY} does not exist yet")
+    plan = make_plan(project_id)
+    print_plan(plan)
+    with open(args.plan, "w") as f:
+        json.dump(plan, f, indent=1, ensure_ascii=False)
+    print(f"  Plan written to {args.plan}; run with --apply {args.plan} to carry it out")
+    return PROJECT_KEY
+
+
+def load_plan(path):
+    with open(path, encoding="utf-8") as f:
+        plan = json.load(f)
+    if plan.get("version") != PLAN_VERSION:
+        raise ValueError(f"{path}: unsupported plan version {plan.get('version')!r}")
+    if plan.get("site") != JIRA_BASE_URL:
+        raise ValueError(f"{path}: plan was made for {plan.get('site')}, not {JIRA_BASE_URL}")
+    return plan
+
+
+def apply_item(project_key, item):
+    """Carry out one update or no-op from a plan; return the issue key."""
+    fields, key = item["fields"], item["key"]
+    if item["action"] == "update":
+        jira_put(f"/issue/{key}", {
+            "fields": {"summary": fields["summary"], "description": fields["description"]},
+            "update": {"labels": [{"add": item["label"]}]},
+        })
+        indent = "    " if item["type"] == "Epic" else "      "
+        print(f"{indent}Updated {item['type'].lower()}: {key}  \"{item['summary']}\"")
+    record_synced(project_key, item["type"], key, fields)
+    return key
+
+
+def apply_plan(args):
+    """Carry out the plan in args.apply; return the project key."""
+    global PROJECT_KEY, PROJECT_NAME, PROJECT_DESC
+    try:
+        plan = load_plan(args.apply)
+    except (OSError, ValueError) as e:
+        sys.exit(f"ERROR: {e}")
+    project = plan["project"]
+    PROJECT_KEY, PROJECT_NAME, PROJECT_DESC = project["key"], project["name"], project["description"]
+    print(f"=== AccessVBA → Azure SQL Migration — Jira Setup (applying {args.apply}) ===\n")
+
+    print("[1/3] Project")
+    if project["action"] == "create":
+        with profile_phase("project"):
+            project_key, _ = get_or_create_project()
+    else:
+        project_key = project["key"]
+        print(f"  Project {project_key} (id={project['id']}) per plan")
+
+    print("\n[2/3] Epics and Stories")
+    with profile_phase("epics and stories"):
+        epics_map = apply_items(project_key, plan["items"], args.bulk)
+    write_transitions_and_readme(project_key, epics_map)
+    return project_key
+
+
+def apply_items(project_key, items, bulk):
+    """Carry out a plan's items in order; return {epic_summary: epic_key}."""
+    keys, epics_map, creates = {}, {}, []
+    for item in items:
+        if item["type"] == "Story":
+            item["fields"]["parent"] = {"key": keys[item["parent"]]}
+        done = MANIFEST.get(project_key, item["label"]) if MANIFEST is not None else None
+        if item["action"] != "create":
+            keys[item["label"]] = apply_item(project_key, item)
+        elif done:  # created by an earlier, interrupted --apply
+            keys[item["label"]] = done["key"]
+        elif item["type"] == "Story" and bulk:
+            creates.append(item)
+            continue
+        else:
+            keys[item["label"]] = key = create_issue(item["fields"])
+            record_synced(project_key, item["type"], key, item["fields"])
+            indent = "    " if item["type"] == "Epic" else "      "
+            print(f"{indent}Created {item['type'].lower()}: {key}  \"{item['summary']}\"")
+        if item["type"] == "Epic":
+            epics_map[item["summary"]] = keys[item["label"]]
+
+    failures = 0
+    for item, (key, error) in zip(creates, create_issues_bulk([i["fields"] for i in creates])):
+        if key:
+            record_synced(project_key, "Story", key, item["fields"])
+            print(f"      Created story: {key}  \"{item['summary']}\"")
+        else:
+            failures += 1
+            print(f"      FAILED story: \"{item['summary']}\" — {error}")
+    if failures:
+        print(f"\n  {failures} stories were rejected; fix them in BOARD, plan and apply again.")
+    return epics_map
+
+
+# ---------------------------------------------------------------------------
+# Workflow transitions
+# The transitions open to an issue depend only on its project, issue type and
+# current status, so each combination is fetched from Jira once and kept in
+# memory and in the sync manifest. --set-status moves BOARD items with one
+# POST each on a bounded thread pool, and skips items already in the target
+# status without a request.
+# ---------------------------------------------------------------------------
+
+TRANSITION_WORKERS = 8
+_TRANSITIONS = {}  # {(project_key, issue_type, status): {transition_name: {"id", "to"}}}
+_TRANSITIONS_LOCK = threading.Lock()
+
+
+def transition_map(project_key, issue_type, status, issue_key, refresh=False):
+    """Return the transitions open to `issue_key`, an issue_type in `status`.
+
+    `refresh` skips both caches, for when Jira rejected a cached transition.
+    """
+    transitions = None if refresh else cached_transitions(project_key, issue_type, status)
+    if transitions is None:
+        data = jira_get(f"/issue/{issue_key}/transitions")
+        transitions = store_transitions(project_key, issue_type, status, data)
+    return transitions
+
+
+def cached_transitions(project_key, issue_type, status):
+    """Return the remembered transitions for this (type, status), or None."""
+    ident = (project_key, issue_type, status)
+    with _TRANSITIONS_LOCK:
+        if ident in _TRANSITIONS:
+            return _TRANSITIONS[ident]
+    stored = MANIFEST and MANIFEST.get_entry(project_key, "transitions", f"{issue_type}|{status}")
+    if stored:
+        with _TRANSITIONS_LOCK:
+            return _TRANSITIONS.setdefault(ident, stored)
+    return None
+
+
+def store_transitions(project_key, issue_type, status, data):
+    """Remember a GET /issue/{key}/transitions response; return it as {name: {id, to}}."""
+    transitions = {t["name"]: {"id": t["id"], "to": t["to"]["name"]}
+                   for t in data.get("transitions", [])}
+    with _TRANSITIONS_LOCK:
+        _TRANSITIONS[(project_key, issue_type, status)] = transitions
+    if MANIFEST is not None:
+        MANIFEST.set_entry(project_key, "transitions", f"{issue_type}|{status}", transitions)
+    return transitions
+
+
+def get_transition_ids(project_key):
+    """Return a dict of {transition_name: id} for the first issue found."""
+    first = next(search_issues(f'project = "{project_key}"', fields="issuetype,status", limit=1), None)
+    if first is None:
+        return {}
+    fields = first["fields"]
+    transitions = transition_map(project_key, fields["issuetype"]["name"],
+                                 fields["status"]["name"], first["key"])
+    return {name: t["id"] for name, t in transitions.items()}
+
+
+def parse_status_rules(values):
+    """Turn repeated "SUMMARY=STATUS" arguments into {normalized summary: status}."""
+    rules = {}
+    for value in values:
+        summary, sep, status = value.rpartition("=")
+        if not sep or not summary.strip() or not status.strip():
+            raise ValueError(f'--set-status expects "SUMMARY=STATUS", got "{value}"')
+        rules[normalize_summary(summary)] = status.strip()
+    return rules
+
+
+def status_targets(rules):
+    """Return [(issue_type, summary, label, status)] for the BOARD items in `rules`.
+
+    A status given for an epic applies to its stories as well, unless a
+    story has a rule of its own.
+    """
+    targets, unmatched = [], set(rules)
+    for block in BOARD:
+        epic_ident = normalize_summary(block["epic_summary"])
+        epic_status = rules.get(epic_ident)
+        if epic_status:
+            unmatched.discard(epic_ident)
+            targets.append(("Epic", block["epic_summary"],
+                            board_label("Epic", block.get("epic_id") or block["epic_summary"]), epic_status))
+        for story_summary, _ in block["stories"]:
+            story_ident = normalize_summary(story_summary)
+            unmatched.discard(story_ident)
+            status = rules.get(story_ident, epic_status)
+            if status:
+                targets.append(("Story", story_summary,
+                                board_label("Story", story_id(block, story_summary) or story_summary), status))
+    if unmatched:
+        raise ValueError("--set-status names no epic or story in the board: "
+                         + ", ".join(f'"{u}"' for u in sorted(unmatched)))
+    return targets
+
+
+def transition_issue(project_key, issue_type, key, status, target):
+    """Move one issue from `status` to `target`; return (ok, log line)."""
+    for refresh in (False, True):
+        transitions = transition_map(project_key, issue_type, status, key, refresh=refresh)
+        match = next((t for t in transitions.values()
+                      if t["to"].casefold() == target.casefold()), None)
+        if match is None:
+            error = f'no transition from "{status}" to "{target}"'
+            continue
+        r = CLIENT.request("POST", f"/issue/{key}/transitions",
+                           data=json_dumps({"transition": {"id": match["id"]}}), expected=(400,))
+        if r.ok:
+            return True, f"    {key}: {status} → {match['to']}"
+        if r.status_code != 400:
+            print(f"  ERROR {r.status_code}: {r.text[:400]}")
+            r.raise_for_status()
+        # The cached map may be out of date with the workflow; refetch once
+        error = r.text[:200]
+    return False, f"    FAILED {key}: {error}"
+
+
+def set_statuses(project_key, targets, workers=TRANSITION_WORKERS):
+    """Apply [(issue_type, summary, label, status)] targets; return the number that failed."""
+    index, current = IssueIndex(), {}  # current: {key: status}
+    for h in search_issues(index_jql(project_key), fields="summary,issuetype,labels,status", page_size=100):
+        index.add(h)
+        current[h["key"]] = h["fields"]["status"]["name"]
+
+    outcome = [None] * len(targets)  # (ok, log line), in BOARD order
+    pending = []
+    for n, (issue_type, summary, label, target) in enumerate(targets):
+        key, _ = index.lookup(issue_type, summary, label)
+        if key is None:
+            outcome[n] = (False, f"    FAILED {issue_type.lower()} \"{summary}\": not found in {project_key}")
+        elif current[key].casefold() == target.casefold():
+            outcome[n] = (True, f"    {key}: already {current[key]}")
+        else:
+            pending.append((n, issue_type, key, current[key], target))
+
+    # Fetch each (issue type, status) map once before fanning out
+    for _, issue_type, key, status, _ in pending:
+        transition_map(project_key, issue_type, status, key)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(transition_issue, project_key, issue_type, key, status, target): n
+            for n, issue_type, key, status, target in pending
+        }
+        for future in as_completed(futures):
+            outcome[futures[future]] = future.result()
+
+    for _, line in outcome:
+        print(line)
+    return sum(1 for ok, _ in outcome if not ok)
+
+
+# ---------------------------------------------------------------------------
+# Async engine
+# --async N creates epics and stories from one asyncio event loop on aiohttp
+# (pip install aiohttp) instead of a thread pool, with up to N requests in
+# flight over one connection pool. AsyncJira covers the operations of the
+# blocking helpers: project lookup and creation, paginated search, issue
+# create/update, transition maps and transitions. It shares their rate
+# limiter, request hooks, sync manifest, issue index and journal, and sorts
+# BOARD items into create/update/no-op by the same rules as --plan.
+# run_async() is the blocking wrapper the rest of the script calls.
+# ---------------------------------------------------------------------------
+
+ASYNC_CONCURRENCY = 100
+IDEMPOTENT = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+
+
+class AsyncResponse:
+    """The parts of a requests.Response the helpers and the limiter read."""
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class AsyncJira:
+    """asyncio client for the calls setup_jira.py makes; use with `async with`.
+
+    At most `concurrency` requests are in flight. Like JiraClient, each
+    request waits on the shared rate limiter, 429/503 responses are retried
+    once the limiter's backoff has passed, connection failures and 502/504
+    on idempotent methods are retried JIRA_MAX_RETRIES times with
+    exponential backoff, and every call is reported once to REQUEST_HOOKS.
+    """
+
+    timeout_for = JiraClient.timeout_for
+
+    def __init__(self, concurrency=ASYNC_CONCURRENCY, base_url=None, limiter=None,
+                 max_retries=JIRA_MAX_RETRIES, throttle_retries=JIRA_THROTTLE_RETRIES,
+                 timeouts=TIMEOUTS, compress=False):
+        self.base_url = f"{base_url or JIRA_BASE_URL}/rest/api/3"
+        self.concurrency = concurrency
+        self.limiter = limiter or LIMITER
+        self.max_retries = max_retries
+        self.throttle_retries = throttle_retries
+        self.timeouts = timeouts
+        self.compress = compress
+
+    async def __aenter__(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise RuntimeError("the async engine needs aiohttp (pip install aiohttp)")
+        self.aiohttp = aiohttp
+        self.slots = asyncio.Semaphore(self.concurrency)
+        self.index_lock = asyncio.Lock()
+        credentials = base64.b64encode(f"{JIRA_EMAIL}:{JIRA_API_TOKEN}".encode("utf-8")).decode("ascii")
+        self.session = aiohttp.ClientSession(
+            headers=dict(HEADERS, Authorization=f"Basic {credentials}"),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    # -- transport ----------------------------------------------------------
+
+    async def request(self, method, path, expected=(), data=None):
+        """Send one call. `expected` lists error statuses the caller handles."""
+        if CACHE is not None and method != "GET" and not path.startswith("/search"):
+            CACHE.invalidate(path)
+        headers = {}
+        if self.compress and data and len(data) >= JIRA_GZIP_MIN:
+            data = gzip.compress(data, compresslevel=5)
+            headers["Content-Encoding"] = "gzip"
+        connect, read = self.timeout_for(path)
+        timeout = self.aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        call = {
+            "method":    method,
+            "endpoint":  path_template(path),
+            "status":    None,
+            "expected":  False,
+            "latency_s": 0.0,
+            "wait_s":    0.0,
+            "retries":   0,
+            "throttled": 0,
+            "bytes_out": len(data or b""),
+            "bytes_in":  0,
+        }
+        try:
+            attempt = failures = 0
+            while True:
+                call["wait_s"] += await self.limiter.acquire_async()
+                start = time.perf_counter()
+                try:
+                    async with self.slots, self.session.request(
+                            method, self.base_url + path, data=data,
+                            headers=headers, timeout=timeout) as r:
+                        content = await r.read()
+                        wire = int(r.headers.get("Content-Length") or len(content))
+                        response = AsyncResponse(str(r.url), r.status, r.headers, content)
+                except self.aiohttp.ClientConnectorError:
+                    if failures >= self.max_retries:
+                        raise
+                    response = None
+                finally:
+                    call["latency_s"] += time.perf_counter() - start
+
+                if response is None or (response.status_code in (502, 504) and method in IDEMPOTENT
+                                        and failures < self.max_retries):
+                    await asyncio.sleep(0.5 * 2 ** failures)
+                    failures += 1
+                    call["retries"] += 1
+                    continue
+                call["status"] = response.status_code
+                call["expected"] = response.status_code in expected
+                call["bytes_in"] += wire
+                delay = self.limiter.feedback(response, attempt)
+                if delay is None or attempt >= self.throttle_retries:
+                    return response
+                attempt += 1
+                call["retries"] += 1
+                call["throttled"] += 1
+        finally:
+            for hook in REQUEST_HOOKS:
+                hook(call)
+
+    async def get(self, path, expected=()):
+        r = await self.request("GET", path, expected=expected)
+        r.raise_for_status()
+        return json_loads(r.content)
+
+    async def post(self, path, body):
+        r = await self.request("POST", path, data=json_dumps(body))
+        if not r.ok:
+            print(f"  ERROR {r.status_code}: {r.text[:400]}")
+            r.raise_for_status()
+        return json_loads(r.content)
+
+    async def put(self, path, body, expected=()):
+        r = await self.request("PUT", path, data=json_dumps(body), expected=expected)
+        if not r.ok:
+            if r.status_code not in expected:
+                print(f"  ERROR {r.status_code}: {r.text[:400]}")
+            r.raise_for_status()
+        return json_loads(r.content) if r.content else None
+
+    async def search(self, jql, fields, page_size=50, limit=None):
+        """Async generator counterpart of search_issues()."""
+        if isinstance(fields, str):
+            fields = fields.split(",")
+        body = {"jql": jql, "fields": fields, "maxResults": page_size}
+        yielded = 0
+        while True:
+            if limit is not None:
+                body["maxResults"] = min(page_size, limit - yielded)
+            result = await self.post("/search/jql", body)
+            for issue in result.get("issues", []):
+                yield issue
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+            token = result.get("nextPageToken")
+            if not token or result.get("isLast"):
+                return
+            body["nextPageToken"] = token
+
+    # -- operations ---------------------------------------------------------
+
+    async def get_or_create_project(self):
+        known = known_project()
+        if known:
+            return PROJECT_KEY, known
+        try:
+            proj = await self.get(f"/project/{PROJECT_KEY}", expected=(404,))
+            print(f"  Project {PROJECT_KEY} already exists: {proj['name']}")
+            remember_project(proj["key"], proj["id"])
+            return proj["key"], proj["id"]
+        except requests.HTTPError as e:
+            if e.response.status_code != 404:
+                raise
+
+        print(f"  Creating project {PROJECT_KEY} ...")
+        me = await self.get("/myself")
+        result = await self.post("/project", project_body(me["accountId"]))
+        print(f"  Created: {result['key']} (id={result['id']})")
+        remember_project(result["key"], str(result["id"]))
+        return result["key"], str(result["id"])
+
+    async def issue_index(self, project_key):
+        """issue_index() for the event loop: journal replay, else one paginated search."""
+        async with self.index_lock:
+            if project_key in _ISSUE_INDEX:
+                return _ISSUE_INDEX[project_key]
+            index = JOURNAL and JOURNAL.replayed_index(project_key)
+            if index is None:
+                index = IssueIndex()
+                async for h in self.search(index_jql(project_key), fields="summary,issuetype,labels",
+                                           page_size=100):
+                    index.add(h)
+                print(f"  Indexed {len(index)} existing epics/stories in {project_key}")
+                if JOURNAL is not None:
+                    JOURNAL.settle(project_key, index)
+                    JOURNAL.index(project_key, index)
+            _ISSUE_INDEX[project_key] = index
+            return index
+
+    async def create_issue(self, fields):
+        """POST one issue, journaled like create_issue()."""
+        op = JOURNAL.intents([fields])[0] if JOURNAL else None
+        try:
+            result = await self.post("/issue", {"fields": fields})
+        except requests.HTTPError as e:
+            if op is not None and e.response is not None and e.response.status_code < 500:
+                JOURNAL.failed(op)
+            raise
+        if op is not None:
+            JOURNAL.done(op, result["key"])
+        CREATED_KEYS.append(result["key"])
+        return result["key"]
+
+    async def sync_item(self, project_key, issue_type, fields, log=print):
+        """Create, update or leave one BOARD item; return its key.
+
+        As in sync_from_manifest(), an item the manifest has in sync costs
+        nothing and an edited one a single PUT. The rest are sorted by
+        plan_item() against the issue index, which is loaded on first need.
+        """
+        indent = "    " if issue_type == "Epic" else "      "
+        summary, label = fields["summary"], fields["labels"][0]
+        entry = MANIFEST.get(project_key, label) if MANIFEST is not None else None
+        if entry:
+            key, digest = entry["key"], content_hash(fields)
+            if entry["hash"] == digest:
+                log(f"{indent}{issue_type} unchanged: {key}  \"{summary}\"")
+                return key
+            try:
+                await self.put(f"/issue/{key}", {
+                    "fields": {"summary": summary, "description": fields["description"]},
+                    "update": {"labels": [{"add": label}]},
+                }, expected=(404,))
+                MANIFEST.record(project_key, label, key, digest)
+                log(f"{indent}Updated {issue_type.lower()}: {key}  \"{summary}\"")
+                return key
+            except requests.HTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                MANIFEST.forget(project_key, label)  # deleted in Jira since the last run
+
+        index = await self.issue_index(project_key)
+        item = plan_item(project_key, issue_type, fields, index)
+        if item["action"] == "create":
+            key = await self.create_issue(fields)
+            log(f"{indent}Created {issue_type.lower()}: {key}  \"{summary}\"")
+        elif item["action"] == "update":
+            key = item["key"]
+            await self.put(f"/issue/{key}", {
+                "fields": {"summary": summary, "description": fields["description"]},
+                "update": {"labels": [{"add": label}]},
+            })
+            log(f"{indent}Updated {issue_type.lower()}: {key}  \"{summary}\"")
+        else:
+            key = item["key"]
+            log(f"{indent}{issue_type} already exists: {key}  \"{summary}\"")
+        index.remember(label, summary, key)
+        record_synced(project_key, issue_type, key, fields)
+        return key
+
+    async def create_board(self, project_key, board):
+        """Sync `board`, starting each epic's stories as soon as its key is known.
+
+        Output is buffered per epic and printed in board order; returns
+        {epic_summary: epic_key}.
+        """
+        async def epic_with_stories(block, log):
+            fields = epic_fields(project_key, block["epic_summary"], block["epic_description"],
+                                 block.get("epic_id"))
+            epic_key = await self.sync_item(project_key, "Epic", fields, log.append)
+            story_logs = [[] for _ in block["stories"]]
+            await asyncio.gather(*(
+                self.sync_item(project_key, "Story",
+                               story_fields(project_key, epic_key, story_summary, ac_lines,
+                                            story_id(block, story_summary)),
+                               lines.append)
+                for (story_summary, ac_lines), lines in zip(block["stories"], story_logs)
+            ))
+            log.extend(line for lines in story_logs for line in lines)
+            return epic_key
+
+        logs = [[] for _ in board]
+        keys = await asyncio.gather(*(epic_with_stories(block, log) for block, log in zip(board, logs)))
+        for block, lines in zip(board, logs):
+            print(f"\n  Epic: {block['epic_summary']}")
+            for line in lines:
+                print(line)
+        return {block["epic_summary"]: key for block, key in zip(board, keys)}
+
+    async def transition_map(self, project_key, issue_type, status, issue_key, refresh=False):
+        transitions = None if refresh else cached_transitions(project_key, issue_type, status)
+        if transitions is None:
+            data = await self.get(f"/issue/{issue_key}/transitions")
+            transitions = store_transitions(project_key, issue_type, status, data)
+        return transitions
+
+    async def transition_ids(self, project_key):
+        """Return {transition_name: id} for the first issue found."""
+        first = await anext(self.search(f'project = "{project_key}"', fields="issuetype,status",
+                                        limit=1), None)
+        if first is None:
+            return {}
+        fields = first["fields"]
+        transitions = await self.transition_map(project_key, fields["issuetype"]["name"],
+                                                fields["status"]["name"], first["key"])
+        return {name: t["id"] for name, t in transitions.items()}
+
+    async def transition_issue(self, project_key, issue_type, key, status, target):
+        """Move one issue from `status` to `target`; return (ok, log line)."""
+        for refresh in (False, True):
+            transitions = await self.transition_map(project_key, issue_type, status, key, refresh)
+            match = next((t for t in transitions.values()
+                          if t["to"].casefold() == target.casefold()), None)
+            if match is None:
+                error = f'no transition from "{status}" to "{target}"'
+                continue
+            r = await self.request("POST", f"/issue/{key}/transitions", expected=(400,),
+                                   data=json_dumps({"transition": {"id": match["id"]}}))
+            if r.ok:
+                return True, f"    {key}: {status} → {match['to']}"
+            if r.status_code != 400:
+                print(f"  ERROR {r.status_code}: {r.text[:400]}")
+                r.raise_for_status()
+            error = r.text[:200]
+        return False, f"    FAILED {key}: {error}"
+
+
+def run_async(operation, *args, concurrency=ASYNC_CONCURRENCY, compress=False):
+    """Blocking wrapper: run one AsyncJira operation to completion and return its result.
+
+    e.g. run_async("create_board", "AVBA", BOARD, concurrency=200)
+    """
+    async def main():
+        async with AsyncJira(concurrency, compress=compress) as jira:
+            return await getattr(jira, operation)(*args)
+    return asyncio.run(main())
+
+
+# ---------------------------------------------------------------------------
+# Local mirror
+# --mirror copies every issue in the project into a SQLite file so questions
+# like "which stories are still To Do" are answered locally. The first sync
+# pages through the whole project; later ones only ask for issues with
+# `updated >=` the newest timestamp already mirrored. JQL compares dates in
+# the user's Jira time zone at minute resolution, so the watermark is
+# converted to that zone and rounded down; the few issues refetched at the
+# boundary are simply upserted again. Issues deleted in Jira stay in the
+# mirror until it is rebuilt (delete the file).
+# ---------------------------------------------------------------------------
+
+MIRROR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jira_mirror.sqlite")
+MIRROR_FIELDS = "summary,issuetype,parent,status,updated,description"
+
+MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    site        TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    project     TEXT NOT NULL,
+    issue_type  TEXT,
+    parent      TEXT,
+    status      TEXT,
+    summary     TEXT,
+    updated     TEXT,
+    description TEXT,
+    PRIMARY KEY (site, key)
+);
+CREATE INDEX IF NOT EXISTS issues_by_status ON issues (site, project, issue_type, status);
+CREATE TABLE IF NOT EXISTS sync_state (
+    site      TEXT NOT NULL,
+    project   TEXT NOT NULL,
+    watermark TEXT,
+    time_zone TEXT,
+    PRIMARY KEY (site, project)
+);
+"""
+
+
+def parse_jira_time(value):
+    """Parse Jira's "2024-05-01T13:45:12.345+0000" timestamps."""
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+
+
+def adf_text(node):
+    """Flatten an ADF document to plain text, one line per block."""
+    if not node:
+        return ""
+    if node.get("type") == "text":
+        return node.get("text", "")
+    parts = [adf_text(child) for child in node.get("content", [])]
+    if node.get("type") in ("doc", "bulletList", "orderedList"):
+        return "\n".join(p for p in parts if p)
+    if node.get("type") == "listItem":
+        return "- " + " ".join(parts)
+    return "".join(parts)
+
+
+class JiraMirror:
+    """SQLite copy of a project's issues, kept current by incremental sync."""
+
+    def __init__(self, path=None, site=None):
+        self.path = path or MIRROR_PATH
+        self.site = site or JIRA_BASE_URL
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(MIRROR_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def state(self, project_key):
+        row = self.db.execute("SELECT watermark, time_zone FROM sync_state WHERE site = ? AND project = ?",
+                              (self.site, project_key)).fetchone()
+        return row or (None, None)
+
+    def sync(self, project_key):
+        """Fetch issues changed since the last sync; return how many came back."""
+        watermark, time_zone = self.state(project_key)
+        if time_zone is None:
+            time_zone = jira_get("/myself").get("timeZone") or "UTC"
+        try:
+            zone = ZoneInfo(time_zone)
+        except (ZoneInfoNotFoundError, ValueError):
+            zone = timezone.utc
+
+        jql = f'project = "{project_key}"'
+        if watermark:
+            since = datetime.fromisoformat(watermark).astimezone(zone)
+            jql += f' AND updated >= "{since:%Y/%m/%d %H:%M}"'
+        jql += " ORDER BY updated ASC"
+
+        fetched, newest = 0, watermark and datetime.fromisoformat(watermark)
+        rows = []
+        for h in search_issues(jql, fields=MIRROR_FIELDS, page_size=100):
+            fields = h["fields"]
+            updated = parse_jira_time(fields["updated"])
+            newest = max(newest, updated) if newest else updated
+            rows.append((
+                self.site, h["key"], project_key,
+                fields["issuetype"]["name"],
+                (fields.get("parent") or {}).get("key"),
+                fields["status"]["name"],
+                fields["summary"],
+                updated.astimezone(timezone.utc).isoformat(),
+                adf_text(fields.get("description")),
+            ))
+            fetched += 1
+            if len(rows) >= 500:
+                self._upsert(rows)
+                rows = []
+        self._upsert(rows)
+        self.db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                        (self.site, project_key, newest and newest.isoformat(), time_zone))
+        self.db.commit()
+        return fetched
+
+    def _upsert(self, rows):
+        self.db.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def epics(self, project_key):
+        """Return [(summary, key)] for the project's epics, oldest first."""
+        return self.db.execute(
+            "SELECT summary, key FROM issues WHERE site = ? AND project = ? AND issue_type = 'Epic' "
+            "ORDER BY CAST(substr(key, instr(key, '-') + 1) AS INTEGER)",
+            (self.site, project_key)).fetchall()
+
+    def status_counts(self, project_key):
+        """Return [(epic_key, epic_summary, status, story_count)] for the project."""
+        return self.db.execute(
+            "SELECT e.key, e.summary, s.status, COUNT(*) FROM issues s "
+            "JOIN issues e ON e.site = s.site AND e.key = s.parent "
+            "WHERE s.site = ? AND s.project = ? AND s.issue_type = 'Story' "
+            "GROUP BY e.key, s.status "
+            "ORDER BY CAST(substr(e.key, instr(e.key, '-') + 1) AS INTEGER), s.status",
+            (self.site, project_key)).fetchall()
+
+
+def run_mirror(args):
+    """Sync the local mirror, print story status per epic and refresh the README."""
+    print("=== AccessVBA → Azure SQL Migration — Jira Mirror ===\n")
+    mirror = JiraMirror(args.mirror_path)
+    try:
+        fetched = mirror.sync(PROJECT_KEY)
+        watermark, _ = mirror.state(PROJECT_KEY)
+        print(f"  {fetched} issues fetched into {mirror.path} (watermark {watermark})")
+
+        print(f"\n  {'Epic':<12} {'Status':<14} {'Stories':>7}  Summary")
+        for epic_key, epic_summary, status, count in mirror.status_counts(PROJECT_KEY):
+            print(f"  {epic_key:<12} {status:<14} {count:>7}  {epic_summary}")
+
+        # BOARD order first, then any epics added in Jira by hand
+        by_summary = {}
+        for summary, key in mirror.epics(PROJECT_KEY):
+            by_summary.setdefault(normalize_summary(summary), (summary, key))  # oldest wins
+        epics_map = {}
+        for block in BOARD:
+            found = by_summary.pop(normalize_summary(block["epic_summary"]), None)
+            if found:
+                epics_map[found[0]] = found[1]
+        epics_map.update(by_summary.values())
+    finally:
+        mirror.close()
+
+    transition_ids = MANIFEST and MANIFEST.project(PROJECT_KEY).get("transition_ids")
+    write_readme(PROJECT_KEY, epics_map, transition_ids)
+    return PROJECT_KEY
+
+
+# ---------------------------------------------------------------------------
+# README generation
+# ---------------------------------------------------------------------------
+
+README_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "README.md")
+
+# The README is rendered only from results a run already has: epic keys,
+# transition IDs and the constants above. Each run records the epic keys in
+# the manifest next to a hash of the board they came from, so --readme-only
+# can re-render without asking Jira while that board is unchanged.
+
+
+def board_hash(board):
+    """Hash a board's epics and stories; tuples hash the same as lists."""
+    rendered = json.dumps(board, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()
+
+
+def board_epic_keys(project_key):
+    """Return {epic_summary: epic_key} for BOARD, asking Jira only about epics the manifest lacks."""
+    epics_map, index = {}, None
+    for block in BOARD:
+        summary = block["epic_summary"]
+        label = board_label("Epic", block.get("epic_id") or summary)
+        entry = MANIFEST and MANIFEST.get(project_key, label)
+        if entry:
+            key = entry["key"]
+        else:
+            if index is None:
+                index = issue_index(project_key)
+            key, _ = index.lookup("Epic", summary, label)
+        if key:
+            epics_map[summary] = key
+        else:
+            print(f"  Epic not created yet, left out: {summary}")
+    return epics_map
+
+
+def run_readme_only(args):
+    """Re-render the README from cached results; Jira is asked only for what is missing."""
+    print("=== AccessVBA → Azure SQL Migration — README ===\n")
+    cached = MANIFEST and MANIFEST.project(PROJECT_KEY).get("readme")
+    if cached and cached["board"] == board_hash(BOARD):
+        epics_map = cached["epics"]
+        print(f"  {len(epics_map)} epic keys (from sync manifest)")
+    else:
+        epics_map = board_epic_keys(PROJECT_KEY)
+    transition_ids = find_transition_ids(PROJECT_KEY)
+    write_readme(PROJECT_KEY, epics_map, transition_ids)
+    return PROJECT_KEY
+
+
 def write_readme(project_key, epics_map, transition_ids):
+    """Render the README; the file is only rewritten when its content changes."""
     lines = [
         f"# {PROJECT_NAME}",
         "",
@@ -496,7 +3113,30 @@ def write_readme(project_key, epics_map, transition_ids):
         "python setup_jira.py",
         "```",
         "",
+        "| Option | Effect |",
+        "|---|---|",
+        "| `--bulk` | Create missing stories through `/issue/bulk`, 50 per request |",
+        "| `--workers N` | Create epics and stories one request each on N threads |",
+        "| `--async N` | Create epics and stories from an asyncio event loop with up to N requests in flight (needs `aiohttp`) |",
+        "| `--set-status SUMMARY=STATUS` | Move an epic (with its stories) or a story to STATUS; repeatable |",
+        "| `--stream` | Create the board through a bounded producer/consumer pipeline; a `.jsonl` board is read a line at a time |",
+        "| `--board PATH` | Read epics and stories from a YAML, JSON or JSON Lines file instead of `BOARD` |",
+        "| `--mirror` | Sync `jira_mirror.sqlite`, print story status per epic, rewrite this README; creates nothing |",
+        "| `--readme-only` | Re-render this README from the keys in `.jira_sync.json`; no API calls unless something is missing |",
+        "| `--compact` | Gzip request bodies of `JIRA_GZIP_MIN` bytes or more (responses are always accepted gzipped) |",
+        "| `--cache` | Reuse `/myself` and `/project` responses from `.jira_cache.json` until their TTL, then revalidate with ETags |",
+        "| `--projects PATH` | Set up every project listed in PATH on `--processes N` worker processes sharing one rate budget |",
+        "| `--plan [PATH]` | Print the creates, updates and no-ops a run would make, changing nothing, and save them to PATH |",
+        "| `--apply PATH` | Carry out a plan saved by `--plan` without recomputing it |",
+        "| `--profile [DIR]` | Profile CPU (cProfile) and memory (tracemalloc) per phase; reports go to DIR |",
+        "| `--no-manifest` | Ignore `.jira_sync.json` and check every item against Jira |",
+        "| `--metrics PATH` | Where to write per-endpoint request metrics (`''` to skip) |",
+        "",
         "The script is idempotent — safe to re-run if it fails partway through.",
+        "Keys and content hashes of synced issues are kept in `.jira_sync.json`",
+        "next to the script: unchanged items cost no API calls on re-runs, and",
+        "edited ones are updated in place with one `PUT` each. An interrupted run",
+        "leaves `.jira_journal.jsonl` behind, and the next run resumes from it.",
         "",
         "---",
         "",
@@ -507,53 +3147,424 @@ def write_readme(project_key, epics_map, transition_ids):
         "> if it has ever appeared in plain text in a chat, email, or terminal log.",
     ]
 
-    readme_path = os.path.join(os.path.dirname(__file__), "README.md")
-    with open(readme_path, "w") as f:
-        f.write("\n".join(lines) + "\n")
-    print(f"\n  README written to {readme_path}")
+    rendered = "\n".join(lines) + "\n"
+    try:
+        with open(README_PATH) as f:
+            unchanged = f.read() == rendered
+    except FileNotFoundError:
+        unchanged = False
+    if unchanged:
+        print(f"\n  README unchanged: {README_PATH}")
+    else:
+        with open(README_PATH, "w") as f:
+            f.write(rendered)
+        print(f"\n  README written to {README_PATH}")
+
+    cache = {"board": board_hash(BOARD), "epics": epics_map}
+    if MANIFEST is not None and MANIFEST.project(project_key).get("readme") != cache:
+        MANIFEST.set_value(project_key, "readme", cache)
+
+
+# ---------------------------------------------------------------------------
+# Multi-project fan-out
+# --projects PATH sets up every project listed in a file of the form
+#
+#     projects:
+#       - key: AVB2
+#         name: AccessVBA to Azure SQL Migration (site 2)
+#         description: ...
+#         board: boards/site2.yaml   # optional; relative to this file
+#
+# on a pool of worker processes. The workers share one token bucket in
+# shared memory, so together they stay within the tenant's rate limit and
+# back off together on a 429. Each project's output goes to its own log, a
+# failure in one project is reported without stopping the others, and the
+# parent merges every project's sync manifest entries and writes one
+# combined report.
+# ---------------------------------------------------------------------------
+
+def _shared(index):
+    return property(lambda self: self.state[index],
+                    lambda self, value: self.state.__setitem__(index, value))
+
+
+class SharedRateLimiter(RateLimiter):
+    """RateLimiter whose bucket lives in shared memory, for worker processes.
+
+    time.monotonic() is system-wide, so timestamps agree across processes.
+    """
+
+    rate, burst, tokens, updated, paused_until = (_shared(i) for i in range(5))
+
+    def __init__(self, state, lock, min_rate=JIRA_MIN_RATE, max_rate=JIRA_MAX_RATE,
+                 increase=0.5, max_backoff=60.0):
+        self.state = state
+        self.lock = lock
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.max_backoff = max_backoff
+
+    @staticmethod
+    def create_state(rate=None):
+        """Return (state, lock) for a new shared bucket, to hand to workers."""
+        rate = rate or LIMITER.rate
+        burst = max(1.0, rate)
+        state = multiprocessing.Array("d", [rate, burst, burst, time.monotonic(), 0.0], lock=False)
+        return state, multiprocessing.Lock()
+
+
+def load_projects(path):
+    """Return the validated project specs listed in a --projects file."""
+    with open(path, "rb") as f:
+        data = parse_definition_file(path, f.read())
+    _check_keys("projects file", data, ["projects"])
+    if not isinstance(data["projects"], list) or not data["projects"]:
+        raise BoardError("projects: expected a non-empty list")
+    specs, keys = [], set()
+    for n, spec in enumerate(data["projects"]):
+        where = f"projects[{n}]"
+        _check_keys(where, spec, ["key", "name"], ["description", "board"])
+        key = _check_text(f"{where}.key", spec["key"])
+        if not re.fullmatch(r"[A-Z][A-Z0-9]{1,9}", key):
+            raise BoardError(f"{where}.key: project keys are 2-10 capital letters or digits")
+        if key in keys:
+            raise BoardError(f"{where}.key: duplicate project \"{key}\"")
+        keys.add(key)
+        spec = dict(spec, name=_check_text(f"{where}.name", spec["name"]),
+                    description=_check_text(f"{where}.description", spec.get("description", ""),
+                                            allow_empty=True))
+        if spec.get("board"):
+            board = _check_text(f"{where}.board", spec["board"])
+            spec["board"] = os.path.join(os.path.dirname(os.path.abspath(path)), board)
+        specs.append(spec)
+    return specs
+
+
+WORKER_SETTINGS = ("JIRA_BASE_URL", "MANIFEST_PATH", "JOURNAL_PATH", "CACHE_PATH", "BOARD_CACHE_DIR", "BUILTIN_BOARD")
+
+
+def init_worker(state, lock, settings):
+    """Process pool initializer: take the parent's settings and share its rate budget."""
+    global LIMITER, CLIENT
+    globals().update(settings)
+    LIMITER = SharedRateLimiter(state, lock)
+    CLIENT = JiraClient(JIRA_BASE_URL, AUTH)
+
+
+def provision_project(spec, setup_argv, log_path):
+    """Worker process: set up one project; return its report."""
+    global PROJECT_KEY, PROJECT_NAME, PROJECT_DESC, BOARD, JOURNAL_PATH, README_PATH
+    PROJECT_KEY, PROJECT_NAME, PROJECT_DESC = spec["key"], spec["name"], spec["description"]
+    root, ext = os.path.splitext(JOURNAL_PATH)
+    JOURNAL_PATH = f"{root}.{PROJECT_KEY}{ext}"
+    README_PATH = os.path.join(os.path.dirname(log_path), f"README_{PROJECT_KEY}.md")
+    CREATED_KEYS.clear()
+    METRICS.reset()
+
+    report = {"key": PROJECT_KEY, "log": log_path, "error": None}
+    with open(log_path, "w") as log, contextlib.redirect_stdout(log):
+        try:
+            BOARD = load_board(spec["board"]) if spec.get("board") else BUILTIN_BOARD
+            run(parse_args(setup_argv), save_manifest=False)
+        except BaseException as e:  # SystemExit included: keep the other projects going
+            report["error"] = f"{type(e).__name__}: {e}"
+            traceback.print_exc(file=log)
+    summary = METRICS.summary()
+    report.update(created=list(CREATED_KEYS), requests=summary["requests"], wall_s=summary["wall_s"])
+    if MANIFEST is not None:
+        report["manifest"] = MANIFEST.project(PROJECT_KEY)
+    return report
+
+
+def run_projects(args):
+    """Fan the setup out over every project in args.projects; return the failure count."""
+    try:
+        specs = load_projects(args.projects)
+    except (OSError, BoardError) as e:
+        sys.exit(f"ERROR: {e}")
+    for spec in specs:
+        spec.setdefault("board", args.board and os.path.abspath(args.board))
+
+    setup_argv = ["--metrics", ""]
+    if args.bulk:
+        setup_argv += ["--bulk"]
+    elif args.async_requests:
+        setup_argv += ["--async", str(args.async_requests)]
+    else:
+        setup_argv += ["--workers", str(args.workers)]
+    setup_argv += ["--no-manifest"] if args.no_manifest else []
+    setup_argv += ["--cache"] if args.cache else []
+    setup_argv += ["--compact"] if args.compact else []
+    setup_argv += ["--stream"] if args.stream else []
+
+    stem = os.path.splitext(os.path.abspath(args.projects))[0]
+    log_dir = f"{stem}_logs"
+    os.makedirs(log_dir, exist_ok=True)
+
+    print(f"=== Jira Setup — {len(specs)} projects on {args.processes} processes ===\n")
+    state, lock = SharedRateLimiter.create_state()
+    settings = {name: globals()[name] for name in WORKER_SETTINGS}
+    reports = {}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.processes, initializer=init_worker,
+                             initargs=(state, lock, settings)) as pool:
+        futures = {
+            pool.submit(provision_project, spec, setup_argv,
+                        os.path.join(log_dir, f"{spec['key']}.log")): spec
+            for spec in specs
+        }
+        for future in as_completed(futures):
+            key = futures[future]["key"]
+            try:
+                report = future.result()
+            except Exception as e:  # the worker process itself died
+                report = {"key": key, "error": f"{type(e).__name__}: {e}", "created": []}
+            reports[key] = report
+            status = f"FAILED — {report['error']}" if report["error"] else "ok"
+            print(f"  {key:<10} {len(report['created']):>5} created  {status}")
+
+    if not args.no_manifest:
+        manifest = SyncManifest()
+        for report in reports.values():
+            if report.get("manifest"):
+                manifest.replace_project(report["key"], report["manifest"])
+        manifest.save()
+
+    failures = sum(1 for r in reports.values() if r["error"])
+    combined = {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "site": JIRA_BASE_URL,
+        "wall_s": round(time.perf_counter() - started, 3),
+        "failures": failures,
+        "projects": [{k: v for k, v in reports[s["key"]].items() if k != "manifest"} for s in specs],
+    }
+    with open(f"{stem}_report.json", "w") as f:
+        json.dump(combined, f, indent=2)
+    print(f"\n  {len(specs) - failures} of {len(specs)} projects set up in {combined['wall_s']:.1f}s; "
+          f"report written to {stem}_report.json, logs in {log_dir}")
+    return failures
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Create the AVBA Jira project, epics and stories.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--bulk", action="store_true",
+                      help="create missing stories through /issue/bulk in chunks of 50")
+    mode.add_argument("--workers", type=int, default=1, metavar="N",
+                      help="create epics and stories one request each on N threads")
+    mode.add_argument("--async", dest="async_requests", type=int, metavar="N",
+                      help="create epics and stories from an asyncio event loop with up to "
+                           "N requests in flight (needs aiohttp)")
+    parser.add_argument("--board", metavar="PATH",
+                        help="read epics and stories from a YAML, JSON or JSON Lines file instead of BOARD")
+    parser.add_argument("--stream", action="store_true",
+                        help="create the board through a pipeline with bounded queues; "
+                             "reads a .jsonl board a line at a time")
+    parser.add_argument("--set-status", action="append", default=[], metavar="SUMMARY=STATUS",
+                        help="move an epic (with its stories) or a story to STATUS; repeatable")
+    parser.add_argument("--mirror", action="store_true",
+                        help="only sync the local SQLite mirror of the project, report from it "
+                             "and rewrite the README; creates nothing")
+    parser.add_argument("--readme-only", action="store_true",
+                        help="only re-render the README from cached results; "
+                             "asks Jira just for what the sync manifest lacks")
+    parser.add_argument("--mirror-path", default=MIRROR_PATH, metavar="PATH",
+                        help="SQLite file for --mirror (default: %(default)s)")
+    parser.add_argument("--compact", action="store_true",
+                        help="gzip request bodies of JIRA_GZIP_MIN bytes or more")
+    parser.add_argument("--cache", action="store_true",
+                        help="cache /myself and /project GETs in .jira_cache.json, revalidating with ETags")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help="ignore the local sync manifest and check every item against Jira")
+    parser.add_argument("--metrics", default=METRICS_PATH, metavar="PATH",
+                        help="where to write per-endpoint JSON metrics (default: %(default)s; '' to skip)")
+    planning = parser.add_mutually_exclusive_group()
+    planning.add_argument("--plan", nargs="?", const=PLAN_PATH, metavar="PATH",
+                          help="print what a run would create or update, changing nothing, "
+                               "and save the plan to PATH (default: %(const)s)")
+    planning.add_argument("--apply", metavar="PATH",
+                          help="carry out a plan saved by --plan")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_DIR, metavar="DIR",
+                        help="profile CPU and memory per phase and write the reports to DIR "
+                             "(default: %(const)s)")
+    parser.add_argument("--projects", metavar="PATH",
+                        help="set up every project listed in a YAML or JSON file, in parallel processes")
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1), metavar="N",
+                        help="worker processes for --projects (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.projects and (args.mirror or args.set_status or args.profile):
+        parser.error("--projects cannot be combined with --mirror, --set-status or --profile")
+    if (args.plan or args.apply) and (args.mirror or args.projects or args.stream or args.set_status):
+        parser.error("--plan/--apply cannot be combined with --mirror, --projects, --stream or --set-status")
+    if args.readme_only and (args.mirror or args.projects or args.stream or args.set_status
+                             or args.plan or args.apply):
+        parser.error("--readme-only cannot be combined with --mirror, --projects, --stream, "
+                     "--set-status, --plan or --apply")
+    if args.stream and (args.workers > 1 or args.async_requests):
+        parser.error("--stream submits from a single thread; use it with --bulk, "
+                     "not --workers or --async")
+    if args.stream and args.set_status and is_jsonl(args.board):
+        parser.error("--set-status needs the whole board; it cannot be used with a streamed .jsonl board")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.projects:
+        if run_projects(args):
+            sys.exit(1)
+    else:
+        run(args)
+
+
+def run(args, save_manifest=True):
+    """Set up one project; `save_manifest=False` leaves MANIFEST unsaved for the caller."""
+    global BOARD, CLIENT, MANIFEST, JOURNAL, CACHE, PROFILER
+
+    if args.board and not (args.stream and is_jsonl(args.board)):
+        try:
+            BOARD = load_board(args.board)
+        except (OSError, BoardError) as e:
+            sys.exit(f"ERROR: {e}")
+    try:
+        args.status_targets = status_targets(parse_status_rules(args.set_status))
+    except ValueError as e:
+        sys.exit(f"ERROR: {e}")
+
+    # Give each worker thread its own pooled connection
+    if args.workers > CLIENT.pool_size:
+        CLIENT = JiraClient(JIRA_BASE_URL, AUTH, pool_size=args.workers)
+    CLIENT.compress = args.compact
+    MANIFEST = None if args.no_manifest else SyncManifest()
+    CACHE = ResponseCache() if args.cache else None
+    PROFILER = PhaseProfiler(args.profile) if args.profile else None
+
+    try:
+        if args.mirror:
+            project_key = run_mirror(args)
+        elif args.readme_only:
+            project_key = run_readme_only(args)
+        elif args.plan:
+            project_key = run_plan(args)
+        else:
+            JOURNAL = Journal()
+            if JOURNAL.resumed:
+                print(f"Resuming an interrupted run from {JOURNAL.path}\n")
+            project_key = apply_plan(args) if args.apply else run_setup(args)
+            JOURNAL.finish()
+            JOURNAL = None
+    except BoardError as e:  # a streamed board found bad part-way through
+        sys.exit(f"ERROR: {e}")
+    finally:
+        if JOURNAL is not None:
+            JOURNAL.close()
+            JOURNAL = None
+        if MANIFEST is not None and save_manifest and not args.plan:
+            MANIFEST.save()
+        if CACHE is not None:
+            CACHE.save()
+
+    opened, reused = CLIENT.connection_stats()
+    print(f"\n  HTTP connections: {opened} opened, {reused} reused")
+
+    summary = METRICS.summary()
+    METRICS.print_table(summary)
+    if args.metrics:
+        METRICS.write_json(args.metrics, summary, site=JIRA_BASE_URL,
+                           connections={"opened": opened, "reused": reused})
+        print(f"  Metrics written to {args.metrics}")
+    if PROFILER is not None:
+        PROFILER.finish()
+        PROFILER = None
+
+    print("\nDone.")
+    print(f"Board: {JIRA_BASE_URL}/jira/software/projects/{project_key}/boards")
+
+
+def run_setup(args):
     print("=== AccessVBA → Azure SQL Migration — Jira Setup ===\n")
 
     # 1. Project
     print("[1/3] Project")
-    project_key, _ = get_or_create_project()
+    with profile_phase("project"):
+        project_key, _ = get_or_create_project()
 
     # 2. Epics + Stories
     print("\n[2/3] Epics and Stories")
-    epics_map = {}  # {epic_summary: epic_key}
+    with profile_phase("epics and stories"):
+        epics_map = create_board(project_key, args)
+
+    if args.status_targets:
+        print(f"\n  Statuses ({len(args.status_targets)} items)")
+        with profile_phase("statuses"):
+            failures = set_statuses(project_key, args.status_targets,
+                                    workers=max(args.workers, TRANSITION_WORKERS))
+        if failures:
+            print(f"\n  {failures} items could not be moved; see above.")
+
+    # 3. README
+    write_transitions_and_readme(project_key, epics_map)
+    return project_key
+
+
+def create_board(project_key, args):
+    """Create BOARD the way args asks for; return {epic_summary: epic_key}."""
+    if args.stream:
+        board = iter_board_file(args.board) if is_jsonl(args.board) else BOARD
+        return create_board_streamed(project_key, board, args.bulk)
+    if args.bulk:
+        return create_board_bulk(project_key)
+    if args.workers > 1:
+        return create_board_concurrent(project_key, args.workers)
+    if args.async_requests:
+        return run_async("create_board", project_key, BOARD,
+                         concurrency=args.async_requests, compress=args.compact)
 
+    epics_map = {}  # {epic_summary: epic_key}
     for block in BOARD:
         print(f"\n  Epic: {block['epic_summary']}")
         epic_key = get_or_create_epic(
             project_key,
             block["epic_summary"],
             block["epic_description"],
+            ident=block.get("epic_id"),
         )
         epics_map[block["epic_summary"]] = epic_key
 
         for story_summary, ac_lines in block["stories"]:
-            get_or_create_story(project_key, epic_key, story_summary, ac_lines)
+            get_or_create_story(project_key, epic_key, story_summary, ac_lines,
+                                ident=story_id(block, story_summary))
+    return epics_map
 
-    # 3. README
+
+def write_transitions_and_readme(project_key, epics_map):
     print("\n[3/3] Transition IDs + README")
-    transition_ids = get_transition_ids(project_key)
+    with profile_phase("transitions"):
+        transition_ids = find_transition_ids(project_key)
+    with profile_phase("readme"):
+        write_readme(project_key, epics_map, transition_ids)
+
+
+def find_transition_ids(project_key):
+    transition_ids = MANIFEST and MANIFEST.project(project_key).get("transition_ids")
     if transition_ids:
+        print("  Transitions (from sync manifest):")
+        for name, tid in transition_ids.items():
+            print(f"    {tid:>6}  {name}")
+    elif (transition_ids := get_transition_ids(project_key)):
+        if MANIFEST is not None:
+            MANIFEST.set_value(project_key, "transition_ids", transition_ids)
         print("  Transitions found:")
         for name, tid in transition_ids.items():
             print(f"    {tid:>6}  {name}")
     else:
         print("  No issues exist yet to query transitions from.")
-
-    write_readme(project_key, epics_map, transition_ids)
-
-    print("\nDone.")
-    print(f"Board: {JIRA_BASE_URL}/jira/software/projects/{project_key}/boards")
+    return transition_ids
 
 
 if __name__ == "__main__":
@@ -0,0 +1,556 @@
+"""
+Offline regression tests for setup_jira.py, run against mock_jira.py.
+
+    pip install pytest
+    python -m pytest -q test_setup_jira.py
+"""
+
+import json
+import os
+
+# Point setup_jira at a dummy site before it is imported, so a real .env can
+# never send test traffic to a live tenant.
+os.environ["JIRA_BASE_URL"]  = "http://127.0.0.1:9"
+os.environ["JIRA_EMAIL"]     = "test@example.com"
+os.environ["JIRA_API_TOKEN"] = "test-token"
+
+import pytest  # noqa: E402
+import requests  # noqa: E402
+
+import setup_jira  # noqa: E402
+from mock_jira import start_server  # noqa: E402
+
+BOARD = [
+    {
+        "epic_summary": "Epic one",
+        "epic_description": "First epic.",
+        "stories": [
+            ("Story one A", ["AC 1", "AC 2"]),
+            ("Story one B", ["AC 1"]),
+        ],
+    },
+    {
+        "epic_summary": "Epic two",
+        "epic_description": "Second epic.",
+        "stories": [
+            ("Story two A", ["AC 1", "AC 2", "AC 3"]),
+        ],
+    },
+]
+
+
+@pytest.fixture
+def mock_site(tmp_path, monkeypatch):
+    """Yield a function that starts a mock tenant and points setup_jira at it."""
+    servers = []
+
+    def start(**server_kwargs):
+        server, base_url = start_server(**server_kwargs)
+        servers.append(server)
+        monkeypatch.setattr(setup_jira, "JIRA_BASE_URL", base_url)
+        monkeypatch.setattr(setup_jira, "LIMITER", setup_jira.RateLimiter(rate=1000, max_rate=5000))
+        monkeypatch.setattr(setup_jira, "CLIENT", setup_jira.JiraClient(base_url, setup_jira.AUTH))
+        return server
+
+    monkeypatch.setattr(setup_jira, "BOARD", [dict(b, stories=list(b["stories"])) for b in BOARD])
+    monkeypatch.setattr(setup_jira, "MANIFEST", None)
+    monkeypatch.setattr(setup_jira, "MANIFEST_PATH", str(tmp_path / ".jira_sync.json"))
+    monkeypatch.setattr(setup_jira, "README_PATH", str(tmp_path / "README.md"))
+    monkeypatch.setattr(setup_jira, "JOURNAL_PATH", str(tmp_path / ".jira_journal.jsonl"))
+    monkeypatch.setattr(setup_jira, "CACHE_PATH", str(tmp_path / ".jira_cache.json"))
+    monkeypatch.setattr(setup_jira, "CACHE", None)
+    monkeypatch.setattr(setup_jira, "_ISSUE_INDEX", {})
+    monkeypatch.setattr(setup_jira, "_TRANSITIONS", {})
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def run_setup(*args):
+    """Run main() as a fresh process would; return {"METHOD /template": count}."""
+    setup_jira._ISSUE_INDEX.clear()
+    setup_jira._TRANSITIONS.clear()
+    setup_jira.MANIFEST = None
+    setup_jira.METRICS.reset()
+    setup_jira.main(list(args) + ["--metrics", ""])
+    return {name: e["count"] for name, e in setup_jira.METRICS.summary()["endpoints"].items()}
+
+
+def test_path_template_groups_keys():
+    assert setup_jira.path_template("/issue/AVBA-12") == "/issue/{key}"
+    assert setup_jira.path_template("/issue/AVBA-12/transitions") == "/issue/{key}/transitions"
+    assert setup_jira.path_template("/project/AVBA") == "/project/{key}"
+    assert setup_jira.path_template("/search/jql") == "/search/jql"
+    assert setup_jira.path_template("/issue/bulk") == "/issue/bulk"
+
+
+def test_fresh_run_request_counts(mock_site):
+    server = mock_site()
+    counts = run_setup()
+    assert counts == {
+        "GET /project/{key}": 1,
+        "GET /myself": 1,
+        "POST /project": 1,
+        "POST /search/jql": 2,   # issue index + first issue for transitions
+        "POST /issue": 5,        # 2 epics + 3 stories
+        "GET /issue/{key}/transitions": 1,
+    }
+    assert len(server.tenant.issues) == 5
+    summary = setup_jira.METRICS.summary()
+    assert summary["endpoints"]["GET /project/{key}"]["expected"] == 1
+    assert summary["endpoints"]["GET /project/{key}"]["client_errors"] == 0
+
+
+def test_rerun_unchanged_costs_nothing_and_edit_costs_one_put(mock_site, capsys):
+    server = mock_site()
+    run_setup()
+    assert run_setup() == {}
+
+    setup_jira.BOARD[0]["stories"][1] = ("Story one B", ["AC 1 (edited)"])
+    assert run_setup() == {"PUT /issue/{key}": 1}
+    assert "Updated story" in capsys.readouterr().out
+    story = next(i for i in server.tenant.issues.values() if i["fields"]["summary"] == "Story one B")
+    bullets = story["fields"]["description"]["content"][1]["content"]
+    assert bullets[0]["content"][0]["content"][0]["text"] == "AC 1 (edited)"
+
+
+def test_bulk_maps_element_failures_to_board_entries(mock_site, capsys):
+    server = mock_site()
+    too_long = "x" * 300  # the mock, like Jira, rejects summaries over 255 chars
+    setup_jira.BOARD[0]["stories"].insert(1, (too_long, ["AC"]))
+    counts = run_setup("--bulk")
+    assert counts["POST /issue/bulk"] == 1
+
+    out = capsys.readouterr().out
+    assert f'FAILED story: "{too_long}" — summary:' in out
+    assert "1 stories were rejected" in out
+    created = {i["fields"]["summary"]: key for key, i in server.tenant.issues.items()}
+    assert too_long not in created
+    for summary in ("Story one A", "Story one B", "Story two A"):
+        assert f'Created story: {created[summary]}  "{summary}"' in out
+
+
+def test_bulk_request_level_400_raises(mock_site, monkeypatch):
+    mock_site()
+    run_setup()  # creates the project
+    monkeypatch.setattr(setup_jira, "BULK_CHUNK", 55)  # the mock rejects more than 50
+    fields = [{"project": {"key": "AVBA"}, "summary": f"s{i}", "issuetype": {"name": "Story"}}
+              for i in range(55)]
+    with pytest.raises(requests.HTTPError):
+        setup_jira.create_issues_bulk(fields)
+
+
+def test_429_is_retried_until_it_succeeds(mock_site):
+    server = mock_site(rate_limit=5)
+    for _ in range(15):
+        assert setup_jira.jira_get("/myself")["accountId"]
+    summary = setup_jira.METRICS.summary()
+    assert summary["throttled"] > 0
+    assert summary["endpoints"]["GET /myself"]["client_errors"] == 0
+    assert setup_jira.LIMITER.rate < 1000
+    assert server.tenant.rate_limit == 5
+
+
+def test_set_status_transitions_concurrently_and_skips_done(mock_site, capsys):
+    server = mock_site()
+    run_setup()
+    counts = run_setup("--set-status", "Epic one=Done", "--set-status", "story one b=In Progress")
+    assert counts == {
+        "POST /search/jql": 1,                  # current statuses
+        "GET /issue/{key}/transitions": 1,      # (Story, To Do); (Epic, To Do) is cached
+        "POST /issue/{key}/transitions": 3,
+    }
+    statuses = {i["fields"]["summary"]: i["fields"]["status"]["name"]
+                for i in server.tenant.issues.values()}
+    assert statuses == {"Epic one": "Done", "Story one A": "Done", "Story one B": "In Progress",
+                        "Epic two": "To Do", "Story two A": "To Do"}
+
+    # Already in the target status: one search, no transition requests
+    counts = run_setup("--set-status", "Epic one=Done", "--set-status", "story one b=In Progress")
+    assert counts == {"POST /search/jql": 1}
+    assert "already Done" in capsys.readouterr().out
+
+
+def test_set_status_rejects_unknown_items(mock_site):
+    mock_site()
+    with pytest.raises(SystemExit) as e:
+        run_setup("--set-status", "No such epic=Done")
+    assert 'names no epic or story in the board: "no such epic"' in str(e.value)
+
+
+@pytest.mark.parametrize("manifest", [[], ["--no-manifest"]])
+def test_interrupted_run_resumes_from_the_journal(mock_site, monkeypatch, manifest):
+    server = mock_site()
+    real_post, sent = setup_jira.jira_post, []
+
+    def lose_third_response(path, body):
+        result = real_post(path, body)
+        if path == "/issue":
+            sent.append(result["key"])
+            if len(sent) == 3:
+                raise requests.ConnectionError("connection reset")  # created, never confirmed
+        return result
+
+    monkeypatch.setattr(setup_jira, "jira_post", lose_third_response)
+    with pytest.raises(requests.ConnectionError):
+        run_setup(*manifest)
+    assert os.path.exists(setup_jira.JOURNAL_PATH)
+    monkeypatch.setattr(setup_jira, "jira_post", real_post)
+
+    counts = run_setup(*manifest)
+    # No project check and no index search: one targeted lookup for the
+    # in-doubt create, then the remaining two creates and the README step
+    assert counts == {
+        "POST /search/jql": 2,
+        "POST /issue": 2,
+        "GET /issue/{key}/transitions": 1,
+    }
+    assert sorted(i["fields"]["summary"] for i in server.tenant.issues.values()) == [
+        "Epic one", "Epic two", "Story one A", "Story one B", "Story two A"]
+    assert not os.path.exists(setup_jira.JOURNAL_PATH)
+
+
+@pytest.mark.parametrize("manifest", [[], ["--no-manifest"]])
+def test_renamed_item_with_an_id_is_updated_in_place(mock_site, manifest):
+    server = mock_site()
+    setup_jira.BOARD[1]["story_ids"] = {"Story two A": "two-a"}
+    run_setup(*manifest)
+
+    setup_jira.BOARD[1]["stories"][0] = ('Story two A, reworded: "quotes" ~ AND (parens)', ["AC 1"])
+    setup_jira.BOARD[1]["story_ids"] = {setup_jira.BOARD[1]["stories"][0][0]: "two-a"}
+    counts = run_setup(*manifest)
+    assert counts.get("PUT /issue/{key}") == 1
+    assert "POST /issue" not in counts
+    assert len(server.tenant.issues) == 5
+    assert server.tenant.issues["AVBA-5"]["fields"]["summary"].startswith("Story two A, reworded")
+
+
+def test_untagged_issues_are_adopted_by_summary(mock_site):
+    server = mock_site()
+    run_setup()
+    for issue in server.tenant.issues.values():
+        issue["fields"]["labels"] = ["team-x"]  # as if created before labels
+
+    counts = run_setup("--no-manifest")
+    assert counts["PUT /issue/{key}"] == 5
+    assert "POST /issue" not in counts
+    for issue in server.tenant.issues.values():
+        assert issue["fields"]["labels"][0] == "team-x"
+        assert issue["fields"]["labels"][1].startswith(setup_jira.LABEL_PREFIX)
+    assert run_setup("--no-manifest").get("PUT /issue/{key}") is None
+
+
+def test_version_1_manifest_is_rekeyed_by_label(tmp_path):
+    path = tmp_path / "sync.json"
+    path.write_text(json.dumps({"version": 1, "sites": {"s": {"AVBA": {
+        "issues": {"Story|story one a": {"key": "AVBA-2", "hash": "abc"}}}}}}))
+    manifest = setup_jira.SyncManifest(str(path), site="s")
+    assert manifest.get("AVBA", setup_jira.board_label("Story", "Story One A")) == {"key": "AVBA-2", "hash": ""}
+
+
+def test_response_cache_ttl_etag_and_invalidation(mock_site):
+    mock_site()
+    counts = run_setup("--no-manifest", "--cache")
+    assert counts["GET /project/{key}"] == 1 and counts["GET /myself"] == 1
+
+    # The 404 was not cached and POST /project dropped the entry, so the
+    # next run fetches the project once; after that it is served from disk
+    assert setup_jira.ResponseCache().get("/project/AVBA") is None
+    assert run_setup("--no-manifest", "--cache")["GET /project/{key}"] == 1
+    assert "GET /project/{key}" not in run_setup("--no-manifest", "--cache")
+    assert setup_jira.ResponseCache().get("/myself")["etag"]
+
+    # Expired entries are revalidated with If-None-Match and come back as 304
+    setup_jira.CACHE = setup_jira.ResponseCache()
+    setup_jira.CACHE.get("/project/AVBA")["stored"] -= 3600
+    setup_jira.METRICS.reset()
+    assert setup_jira.jira_get("/project/AVBA")["key"] == "AVBA"
+    assert setup_jira.METRICS.summary()["endpoints"]["GET /project/{key}"]["statuses"] == {"304": 1}
+
+    setup_jira.CLIENT.request("PUT", "/project/AVBA", data="{}", expected=(404,))
+    assert setup_jira.CACHE.get("/project/AVBA") is None
+
+
+def test_manifest_project_id_is_rechecked_after_its_ttl(mock_site, monkeypatch):
+    mock_site()
+    run_setup()
+    assert run_setup() == {}
+    monkeypatch.setitem(setup_jira.CACHE_TTLS, "/project/{key}", 0)
+    assert run_setup() == {"GET /project/{key}": 1}
+
+
+BOARD_YAML = """\
+epics:
+  - summary: Epic one
+    description: First epic.
+    stories:
+      - summary: "Story one A: colons & \\"quotes\\""
+        acceptance_criteria: [AC 1, AC 2]
+      - summary: Story one B
+        id: one-b
+"""
+
+
+def test_board_file_is_validated_and_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(setup_jira, "BOARD_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "board.yaml"
+    path.write_text(BOARD_YAML)
+
+    board = setup_jira.load_board(str(path))
+    assert board == [{
+        "epic_summary": "Epic one",
+        "epic_description": "First epic.",
+        "stories": [('Story one A: colons & "quotes"', ["AC 1", "AC 2"]), ("Story one B", [])],
+        "story_ids": {"Story one B": "one-b"},
+    }]
+
+    # A fresh cache entry is used without parsing the file again
+    def fail(*args):
+        raise AssertionError("board was re-parsed")
+    monkeypatch.setattr(setup_jira, "parse_definition_file", fail)
+    assert setup_jira.load_board(str(path)) == board
+    os.utime(path, ns=(1, 1))  # touched, same content
+    assert setup_jira.load_board(str(path)) == board
+
+    monkeypatch.undo()
+    monkeypatch.setattr(setup_jira, "BOARD_CACHE_DIR", str(tmp_path / "cache"))
+    path.write_text(BOARD_YAML.replace("Story one B", "Story one C"))
+    assert setup_jira.load_board(str(path))[0]["stories"][1][0] == "Story one C"
+
+
+@pytest.mark.parametrize("data, message", [
+    ({}, "board: missing epics"),
+    ({"epics": []}, "epics: expected a non-empty list"),
+    ({"epics": [{"summary": "", "stories": []}]}, "epics[0].summary: must not be empty"),
+    ({"epics": [{"summary": "E", "stories": [{"summary": "x" * 256}]}]},
+     "epics[0].stories[0].summary: longer than 255 characters"),
+    ({"epics": [{"summary": "E", "stories": [{"summary": "S", "acceptance_criteria": [3]}]}]},
+     "epics[0].stories[0].acceptance_criteria[0]: expected a string, got int"),
+    ({"epics": [{"summary": "E", "stories": [{"summary": "S"}, {"summary": " s "}]}]},
+     'epics[0].stories[1].summary: duplicate story " s "'),
+    ({"epics": [{"summary": "E", "stories": [], "owner": "me"}]}, "epics[0]: unknown key(s) owner"),
+    ({"epics": [{"summary": "E", "stories": [{"summary": "S", "id": "x"}, {"summary": "T", "id": "X"}]}]},
+     'epics[0].stories[1].id: duplicate story "X"'),
+])
+def test_board_schema_errors(data, message):
+    with pytest.raises(setup_jira.BoardError) as e:
+        setup_jira.validate_board(data)
+    assert str(e.value) == message
+
+
+def test_mirror_syncs_incrementally_from_the_watermark(mock_site, tmp_path, monkeypatch):
+    server = mock_site()
+    run_setup("--set-status", "Story two A=Done")
+    mirror_path = str(tmp_path / "mirror.sqlite")
+
+    assert run_setup("--mirror", "--mirror-path", mirror_path) == {
+        "GET /myself": 1, "POST /search/jql": 1,
+    }
+    mirror = setup_jira.JiraMirror(mirror_path)
+    assert mirror.status_counts("AVBA") == [
+        ("AVBA-1", "Epic one", "To Do", 2),
+        ("AVBA-4", "Epic two", "Done", 1),
+    ]
+    row = mirror.db.execute("SELECT parent, description FROM issues WHERE key = 'AVBA-2'").fetchone()
+    assert row == ("AVBA-1", "Acceptance Criteria\n- AC 1\n- AC 2")
+    mirror.close()
+
+    # Changes since the last sync show up; /myself is not asked again
+    setup_jira._TRANSITIONS.clear()
+    setup_jira.set_statuses("AVBA", [("Story", "Story one A", setup_jira.board_label("Story", "Story one A"),
+                                      "In Progress")])
+    assert run_setup("--mirror", "--mirror-path", mirror_path) == {"POST /search/jql": 1}
+    mirror = setup_jira.JiraMirror(mirror_path)
+    assert ("AVBA-1", "Epic one", "In Progress", 1) in mirror.status_counts("AVBA")
+    watermark, _ = mirror.state("AVBA")
+    mirror.close()
+
+    # Nothing older than the watermark's minute is fetched again
+    monkeypatch.setattr(setup_jira, "search_issues", lambda jql, **kw: iter(()) if
+                        f'updated >= "{watermark[:16].replace("-", "/").replace("T", " ")}"' in jql
+                        else pytest.fail(jql))
+    assert run_setup("--mirror", "--mirror-path", mirror_path) == {}
+    readme = open(setup_jira.README_PATH).read()
+    assert "| [AVBA-1](" in readme and "| Epic two |" in readme
+    assert len(server.tenant.issues) == 5
+
+
+def test_projects_fan_out_isolates_failures(mock_site, tmp_path, monkeypatch):
+    server = mock_site()
+    monkeypatch.setattr(setup_jira, "BOARD_CACHE_DIR", str(tmp_path / "cache"))
+    board = {"epics": [{"summary": "Only epic", "description": "d",
+                        "stories": [{"summary": "Only story", "acceptance_criteria": ["works"]}]}]}
+    (tmp_path / "board.json").write_text(json.dumps(board))
+    projects = tmp_path / "projects.json"
+    projects.write_text(json.dumps({"projects": [
+        {"key": "ONE", "name": "One", "board": "board.json"},
+        {"key": "TWO", "name": "Two", "board": "board.json"},
+        {"key": "BAD", "name": "Bad", "board": "missing.json"},
+    ]}))
+
+    with pytest.raises(SystemExit) as exit_info:
+        setup_jira.main(["--projects", str(projects), "--processes", "2"])
+    assert exit_info.value.code == 1
+
+    report = json.loads((tmp_path / "projects_report.json").read_text())
+    by_key = {p["key"]: p for p in report["projects"]}
+    assert report["failures"] == 1
+    assert "missing.json" in by_key["BAD"]["error"]
+    for key in ("ONE", "TWO"):
+        assert by_key[key]["error"] is None
+        assert len(by_key[key]["created"]) == 2
+    assert set(server.tenant.projects) == {"ONE", "TWO"}
+    assert (tmp_path / "projects_logs" / "BAD.log").exists()
+
+    manifest = json.loads((tmp_path / ".jira_sync.json").read_text())
+    site = manifest["sites"][setup_jira.JIRA_BASE_URL]
+    assert len(site["ONE"]["issues"]) == len(site["TWO"]["issues"]) == 2
+
+
+def test_adf_built_once_and_hash_unchanged():
+    lines = ["first criterion", "second — criterion"]
+    doc = setup_jira.adf_acceptance_criteria(lines)
+    assert setup_jira.adf_acceptance_criteria(list(lines)) is doc
+    fields = {"summary": "Ünïcode story", "description": doc}
+    plain = json.dumps({"summary": fields["summary"], "description": json.loads(json.dumps(doc))},
+                       sort_keys=True, separators=(",", ":"))
+    assert setup_jira.content_hash(fields) == setup_jira.hashlib.sha256(plain.encode()).hexdigest()
+
+
+def test_compact_mode_sends_fewer_bytes(mock_site):
+    sent, stored = {}, {}
+    for mode in ([], ["--compact"]):
+        server = mock_site()
+        run_setup("--bulk", "--no-manifest", *mode)
+        sent[bool(mode)] = setup_jira.METRICS.summary()["bytes_out"]
+        stored[bool(mode)] = sorted((i["fields"]["summary"], json.dumps(i["fields"]["description"]))
+                                    for i in server.tenant.issues.values())
+    assert stored[True] == stored[False]
+    assert sent[True] < sent[False]
+
+
+def test_stream_jsonl_board_matches_and_reruns_free(mock_site, tmp_path, capsys):
+    server = mock_site()
+    board = tmp_path / "board.jsonl"
+    board.write_text("\n".join(json.dumps({
+        "summary": block["epic_summary"], "description": block["epic_description"],
+        "stories": [{"summary": s, "acceptance_criteria": ac} for s, ac in block["stories"]],
+    }) for block in setup_jira.BOARD) + "\n")
+
+    counts = run_setup("--stream", "--bulk", "--board", str(board))
+    assert counts["POST /issue"] == 2 and counts["POST /issue/bulk"] == 1
+    assert len(server.tenant.issues) == 5
+    readme = (tmp_path / "README.md").read_text()
+    assert all(block["epic_summary"] in readme for block in setup_jira.BOARD)
+    assert run_setup("--stream", "--board", str(board)) == {}
+    assert "3 stories streamed; 0 stories created" in capsys.readouterr().out
+
+
+def test_pipeline_backpressure_and_errors():
+    produced = []
+
+    def source():
+        for n in range(20):
+            produced.append(n)
+            yield n
+
+    def fail_at_five(items):
+        for n in items:
+            if n == 5:
+                raise ValueError("bad item")
+            yield n
+
+    results = setup_jira.pipeline(source(), lambda items: (n * 2 for n in items), depth=2)
+    assert next(results) == 0
+    assert len(produced) <= 8  # bounded queues stop the source running ahead
+    assert list(results) == [n * 2 for n in range(1, 20)]
+
+    with pytest.raises(ValueError, match="bad item"):
+        list(setup_jira.pipeline(iter(range(20)), fail_at_five, depth=2))
+
+
+def test_plan_reads_only_and_apply_carries_it_out(mock_site, tmp_path, capsys):
+    server = mock_site()
+    plan_path = str(tmp_path / "plan.json")
+
+    assert run_setup("--plan", plan_path) == {"GET /project/{key}": 1}
+    assert "Plan: 5 to create, 0 to update, 0 unchanged" in capsys.readouterr().out
+    assert server.tenant.projects == {} and not os.path.exists(setup_jira.MANIFEST_PATH)
+
+    counts = run_setup("--apply", plan_path, "--bulk")
+    assert counts["POST /project"] == 1 and counts["POST /issue"] == 2 and counts["POST /issue/bulk"] == 1
+    assert len(server.tenant.issues) == 5
+    assert run_setup() == {}  # the apply left the manifest in sync
+
+    setup_jira.BOARD[1]["stories"][0] = ("Story two A", ["AC (edited)"])
+    assert run_setup("--plan", plan_path) == {"POST /search/jql": 1}
+    out = capsys.readouterr().out
+    assert "Plan: 0 to create, 1 to update, 4 unchanged" in out
+    assert '~ Story' in out and "(edited since the last sync)" in out
+    assert run_setup("--apply", plan_path) == {"PUT /issue/{key}": 1}
+
+
+def test_profile_writes_reports_per_phase(mock_site, tmp_path, capsys):
+    mock_site()
+    out_dir = tmp_path / "profile"
+    run_setup("--workers", "4", "--profile", str(out_dir))
+
+    summary = json.loads((out_dir / "summary.json").read_text())
+    phases = {p["phase"]: p for p in summary["phases"]}
+    assert list(phases) == ["project", "epics and stories", "transitions", "readme"]
+    assert phases["epics and stories"]["threads"] >= 1
+    assert all(p["hotspots"] and p["peak_mb"] >= 0 for p in phases.values())
+    report = (out_dir / "2-epics-and-stories.txt").read_text()
+    assert "get_or_create_story" in report  # run on pool threads, still profiled
+    assert "Largest live allocations" in report
+    assert (out_dir / "4-readme.prof").exists()
+    assert "Profiles written to" in capsys.readouterr().out
+
+
+def test_async_engine_matches_blocking_run(mock_site, capsys):
+    pytest.importorskip("aiohttp")
+    server = mock_site()
+    counts = run_setup("--async", "50")
+    assert counts["POST /issue"] == 5 and counts["POST /search/jql"] == 2
+    assert len(server.tenant.issues) == 5
+    stories = [i for i in server.tenant.issues.values() if i["fields"]["issuetype"]["name"] == "Story"]
+    assert all(i["fields"]["parent"]["key"] in server.tenant.issues for i in stories)
+    assert run_setup("--async", "50") == {}
+
+    setup_jira.BOARD[0]["stories"][1] = ("Story one B", ["AC 1 (edited)"])
+    assert run_setup("--async", "50") == {"PUT /issue/{key}": 1}
+
+    # The engine's other operations, through the blocking wrapper
+    ids = setup_jira.run_async("transition_ids", "AVBA")
+    assert ids and set(ids) == set(setup_jira.MANIFEST.project("AVBA")["transition_ids"])
+    key = stories[0]["key"]
+    ok, line = setup_jira.run_async("transition_issue", "AVBA", "Story", key, "To Do", "Done")
+    assert ok and server.tenant.issues[key]["fields"]["status"]["name"] == "Done"
+
+
+def test_readme_only_renders_from_the_manifest(mock_site, monkeypatch):
+    mock_site()
+    run_setup()
+    readme = setup_jira.README_PATH
+    before = os.stat(readme).st_mtime_ns
+    assert run_setup("--readme-only") == {}
+    assert os.stat(readme).st_mtime_ns == before  # same content, not rewritten
+
+    monkeypatch.setattr(setup_jira, "PROJECT_DESC", "Edited description.")
+    with open(setup_jira.MANIFEST_PATH) as f:
+        data = json.load(f)
+    data["sites"][setup_jira.JIRA_BASE_URL]["AVBA"]["transition_ids"]["Ship it"] = "99"
+    with open(setup_jira.MANIFEST_PATH, "w") as f:
+        json.dump(data, f)
+    assert run_setup("--readme-only") == {}
+    with open(readme) as f:
+        text = f.read()
+    assert "Edited description." in text and "| Ship it | 99 |" in text
+
+    # A changed board falls back to the recorded keys, and one search for the rest
+    setup_jira.BOARD.append({"epic_summary": "Epic three", "epic_description": "Third.", "stories": []})
+    assert run_setup("--readme-only") == {"POST /search/jql": 1}
+    with open(readme) as f:
+        text = f.read()
+    assert "| Epic one |" in text and "Epic three" not in text